@@ -0,0 +1,64 @@
+"""
+Ball-to-ball collision benchmark: uniform-grid broad phase versus all-pairs,
+for growing ball counts at a constant screen coverage.
+
+    python benchmarks/bench_collisions.py [--counts 100 1000 10000] [--steps 200]
+"""
+
+import argparse, math, time
+
+import numpy as np
+
+import common
+from simulation import Simulation, grid_pairs
+
+
+def all_pairs(x, y, size):
+    i, j = np.triu_indices(x.size, 1)
+    d2 = (x[j] - x[i]) ** 2 + (y[j] - y[i]) ** 2
+    return int((d2 < size * size).sum())
+
+
+def grid_touching(x, y, size):
+    i, j = grid_pairs(x, y, size)
+    d2 = (x[j] - x[i]) ** 2 + (y[j] - y[i]) ** 2
+    return i.size, int((d2 < size * size).sum())
+
+
+def timed(fn, repeat):
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        out = fn()
+    return (time.perf_counter() - t0) / repeat * 1000.0, out
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--counts', type=int, nargs='+', default=[100, 1000, 10000])
+    ap.add_argument('--steps', type=int, default=200)
+    ap.add_argument('--ball-size', type=int, default=12)
+    ap.add_argument('--coverage', type=float, default=0.08, help='fraction of the box covered by balls')
+    ap.add_argument('--max-all-pairs', type=int, default=3000, help='skip all-pairs above this count')
+    args = ap.parse_args()
+
+    size = args.ball_size
+    print(f"{'balls':>7} {'box':>11} {'step ms':>8} {'grid ms':>8} {'cand/ball':>9} {'touching':>8} {'all-pairs ms':>12}")
+    for n in args.counts:
+        side = int(math.sqrt(n * size * size / args.coverage))
+        w, h = side * 4 // 3, side * 3 // 4
+        sim = Simulation(n, w, h, size, seed=1, ball_collisions=True)
+        for _ in range(10):
+            sim.step(1 / 60, 5.0)
+        step_ms, _ = timed(lambda: sim.step(1 / 60, 5.0), args.steps)
+        grid_ms, (cand, touching) = timed(lambda: grid_touching(sim.x, sim.y, size), args.steps)
+        if n <= args.max_all_pairs:
+            brute_ms, brute = timed(lambda: all_pairs(sim.x, sim.y, size), max(1, args.steps // 20))
+            assert brute == touching, (brute, touching)
+            brute = f"{brute_ms:12.3f}"
+        else:
+            brute = f"{'skipped':>12}"
+        print(f"{n:>7} {f'{w}x{h}':>11} {step_ms:8.3f} {grid_ms:8.3f} {cand / n:9.2f} {touching:>8} {brute}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""
+Colour microbenchmark: per-call hex parsing (brighten_color / dim_color)
+versus the memoized tables (bright_lut / dim_ramp) used by the render loop.
+
+    python benchmarks/bench_colors.py [--frames 2000] [--trail 30]
+"""
+
+import argparse, random, time
+
+import common
+from colors import (quantized_color_random, brighten_color, dim_color,
+                    bright_lut, dim_ramp, AGE_LEVELS)
+
+
+def frame_colors_direct(bases, trail):
+    for base in bases:
+        head = brighten_color(base, factor=1.5); mid = brighten_color(base, factor=1.35)
+        for idx in range(trail):
+            age = idx / trail
+            dim_color(head if idx % 3 == 0 else mid, factor=0.45 + (1.0 - age) * 0.55)
+
+
+def frame_colors_lut(bases, trail):
+    levels = [int(idx / trail * AGE_LEVELS) for idx in range(trail)]
+    for base in bases:
+        head = bright_lut(base, 1.5); mid = bright_lut(base, 1.35)
+        for idx in range(trail):
+            dim_ramp(head if idx % 3 == 0 else mid)[levels[idx]]
+
+
+def bench(fn, frames, bases, trail):
+    t0 = time.perf_counter()
+    for f in range(frames):
+        fn(bases[f % len(bases):f % len(bases) + 1], trail)
+    return (time.perf_counter() - t0) / frames * 1e6
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--frames', type=int, default=2000)
+    ap.add_argument('--trail', type=int, default=30)
+    ap.add_argument('--colors', type=int, default=64, help='distinct ball colours cycled through')
+    args = ap.parse_args()
+
+    rng = random.Random(7)
+    bases = [quantized_color_random(solid_bright=True, rng=rng) for _ in range(args.colors)]
+    direct = bench(frame_colors_direct, args.frames, bases, args.trail)
+    lut = bench(frame_colors_lut, args.frames, bases, args.trail)
+    info = dim_ramp.cache_info()
+    print(f"trail={args.trail} colours={args.colors} frames={args.frames}")
+    print(f"  brighten_color/dim_color : {direct:8.1f} us/frame")
+    print(f"  bright_lut/dim_ramp      : {lut:8.1f} us/frame  ({direct / lut:.1f}x)")
+    print(f"  dim_ramp cache           : hits={info.hits} misses={info.misses} size={info.currsize}/{info.maxsize}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,221 @@
+"""
+Frame-time benchmark for ZigZagApp.
+
+Drives the real app for a fixed number of frames per case (fixed dt, fixed seed)
+and reports p50/p95/p99 frame time, canvas item count and memory. Cases are the
+cartesian product of the option lists below. Results can be written as JSON and
+compared against a run from another commit.
+
+    python benchmarks/bench_frames.py                      # tk if a display exists, else stub
+    python benchmarks/bench_frames.py --backend tk --xvfb  # start a local Xvfb first
+    python benchmarks/bench_frames.py --trail on --scanlines on off --trail-len 30 120 \\
+        --speed 5 24 --size 800x600 1920x1080 --out HEAD.json --compare main.json
+    python benchmarks/bench_frames.py --renderer canvas framebuffer   # Canvas items vs NumPy blit
+
+Backends: 'tk' measures _animate_loop plus root.update() (Tk redraw) on a real
+display; 'stub' runs the same code against benchmarks/stubtk.py and measures the
+Python side only (and additionally reports canvas calls per frame).
+"""
+
+import argparse, itertools, json, os, platform, shutil, subprocess, sys, tempfile, time
+
+import common
+
+FRAME_DT = 1.0 / 60.0
+
+
+def start_xvfb(size='1920x1080'):
+    if not shutil.which('Xvfb'):
+        sys.exit('Xvfb not found: install it or drop --xvfb')
+    display = ':%d' % (90 + os.getpid() % 100)
+    proc = subprocess.Popen(['Xvfb', display, '-screen', '0', f'{size}x24', '-nolisten', 'tcp'],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    time.sleep(0.5)
+    os.environ['DISPLAY'] = display
+    return proc
+
+
+def load_backend(name):
+    """Returns (backend, tkinter module); the stub must be installed before zigzag is imported."""
+    if name in ('auto', 'tk'):
+        import tkinter
+        try:
+            tkinter.Tk().destroy()
+            return 'tk', tkinter
+        except tkinter.TclError as e:
+            if name == 'tk':
+                sys.exit(f'no display for the tk backend ({e}); use --xvfb or --backend stub')
+    import stubtk
+    return 'stub', stubtk.install()
+
+
+def rss_kb():
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') // 1024
+    except (OSError, ValueError, AttributeError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    k = min(len(sorted_values) - 1, max(0, int(round(p / 100.0 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[k]
+
+
+def git_commit():
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=common.ROOT,
+                             capture_output=True, text=True, timeout=10)
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run_case(zigzag, tk, backend, case, frames, warmup, seed):
+    root = tk.Tk()
+    root.geometry(f"{case['width']}x{case['height']}")
+    app = zigzag.ZigZagApp(root, seed=seed, renderer=case['renderer'])
+    app.base_speed = case['speed']; app.speed_var.set(case['speed'])
+    app.max_trail_len = case['trail_len']
+    app.trail_var.set(case['trail']); app._on_toggle_trail()
+    app.scan_var.set(case['scanlines']); app._on_toggle_scan()
+    if backend == 'tk':
+        root.update()
+
+    # the app's own timers are stopped; frames are driven here with a fixed dt
+    app.scheduler.stop()
+    app.day.stop()
+    samples = []
+    now = time.perf_counter()
+    app.timestep.reset(now)
+    for i in range(warmup + frames):
+        if i == warmup and hasattr(app.canvas, 'reset'):
+            app.canvas.reset()
+        now += FRAME_DT
+        t0 = time.perf_counter()
+        app._animate_loop(now)
+        if backend == 'tk':
+            root.update()
+        else:
+            root.run_pending()
+        samples.append(time.perf_counter() - t0)
+    app.frame_log.close()
+
+    times = sorted(s * 1000.0 for s in samples[warmup:])
+    result = dict(case)
+    result.update({
+        'frames': len(times),
+        'p50_ms': round(percentile(times, 50), 4),
+        'p95_ms': round(percentile(times, 95), 4),
+        'p99_ms': round(percentile(times, 99), 4),
+        'mean_ms': round(sum(times) / max(1, len(times)), 4),
+        'max_ms': round(times[-1], 4) if times else 0.0,
+        'items': len(app.canvas.find_all()),
+        'rss_kb': rss_kb(),
+    })
+    if backend == 'stub':
+        result['canvas_calls_per_frame'] = round(app.canvas.total() / max(1, len(times)), 1)
+    try:
+        root.destroy()
+    except Exception:
+        pass
+    return result
+
+
+def case_key(r):
+    return (r.get('renderer', 'canvas'), r['trail'], r['scanlines'], r['trail_len'], r['speed'], r['width'], r['height'])
+
+
+def describe(r):
+    return (f"{r.get('renderer', 'canvas')[:6]:6} trail={'on' if r['trail'] else 'off':3} scan={'on' if r['scanlines'] else 'off':3} "
+            f"len={r['trail_len']:<4} speed={r['speed']:<5g} {r['width']}x{r['height']}")
+
+
+def print_results(results, baseline=None):
+    base = {case_key(r): r for r in (baseline or [])}
+    print(f"{'case':65} {'p50':>7} {'p95':>7} {'p99':>7} {'items':>6} {'rss MB':>7}")
+    for r in results:
+        line = (f"{describe(r):65} {r['p50_ms']:7.3f} {r['p95_ms']:7.3f} {r['p99_ms']:7.3f} "
+                f"{r['items']:>6} {r['rss_kb'] / 1024:7.1f}")
+        old = base.get(case_key(r))
+        if old:
+            d50 = (r['p50_ms'] / old['p50_ms'] - 1) * 100 if old['p50_ms'] else 0.0
+            d95 = (r['p95_ms'] / old['p95_ms'] - 1) * 100 if old['p95_ms'] else 0.0
+            line += f"   p50 {d50:+6.1f}%  p95 {d95:+6.1f}%"
+        print(line)
+
+
+def on_off(values):
+    return [v in ('on', '1', 'true', 'yes') for v in values]
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--backend', choices=('auto', 'tk', 'stub'), default='auto')
+    ap.add_argument('--xvfb', action='store_true', help='start a local Xvfb server for the tk backend')
+    ap.add_argument('--frames', type=int, default=600)
+    ap.add_argument('--warmup', type=int, default=60)
+    ap.add_argument('--seed', type=int, default=1)
+    ap.add_argument('--trail', nargs='+', default=['on', 'off'])
+    ap.add_argument('--scanlines', nargs='+', default=['on', 'off'])
+    ap.add_argument('--trail-len', type=int, nargs='+', default=[30])
+    ap.add_argument('--speed', type=float, nargs='+', default=[5.0])
+    ap.add_argument('--size', nargs='+', default=['800x600'])
+    ap.add_argument('--renderer', nargs='+', default=['canvas'], choices=('canvas', 'framebuffer'))
+    ap.add_argument('--out', metavar='JSON', help='write machine-readable results here')
+    ap.add_argument('--compare', metavar='JSON', help='earlier --out file to diff against')
+    args = ap.parse_args()
+
+    xvfb = start_xvfb() if args.xvfb and not os.environ.get('DISPLAY') else None
+    try:
+        backend, tk = load_backend(args.backend)
+        workdir = tempfile.mkdtemp(prefix='zigzag-bench-')
+        cwd = os.getcwd()
+        os.chdir(workdir)   # keep frames_meta/ out of the tree
+        try:
+            import zigzag
+            results = []
+            for renderer, trail, scan, trail_len, speed, size in itertools.product(
+                    args.renderer, on_off(args.trail), on_off(args.scanlines), args.trail_len, args.speed, args.size):
+                w, h = (int(v) for v in size.lower().split('x'))
+                case = {'renderer': renderer, 'trail': trail, 'scanlines': scan, 'trail_len': trail_len,
+                        'speed': speed, 'width': w, 'height': h}
+                results.append(run_case(zigzag, tk, backend, case, args.frames, args.warmup, args.seed))
+        finally:
+            os.chdir(cwd)
+            shutil.rmtree(workdir, ignore_errors=True)
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            old = json.load(f)
+        baseline = old.get('results', [])
+        print(f"baseline: {old.get('commit')} ({old.get('backend')})")
+    print(f"backend: {backend}  commit: {git_commit()}  frames/case: {args.frames}")
+    print_results(results, baseline)
+
+    if args.out:
+        report = {
+            'commit': git_commit(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'backend': backend,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'frames': args.frames,
+            'warmup': args.warmup,
+            'seed': args.seed,
+            'results': results,
+        }
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print('written', args.out)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""
+Wall physics benchmark: Simulation.fast_forward() versus stepping frame by frame
+over the same simulated time, plus the largest position difference between the two.
+Also counts bounces per step in a box barely larger than the ball (continuous
+collision detection: several bounces inside one step).
+
+    python benchmarks/bench_physics.py [--minutes 10] [--speeds 5 24] [--balls 1 50]
+"""
+
+import argparse, time
+
+import numpy as np
+
+import common
+from simulation import Simulation, SPEED_BOOST_MULT
+
+DT = 1 / 60
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--minutes', type=float, default=10.0, help='simulated time per case')
+    ap.add_argument('--speeds', type=float, nargs='+', default=[5.0, 24.0])
+    ap.add_argument('--balls', type=int, nargs='+', default=[1, 50])
+    ap.add_argument('--size', default='800x600')
+    args = ap.parse_args()
+
+    w, h = (int(v) for v in args.size.lower().split('x'))
+    steps = int(args.minutes * 60 / DT)
+    print(f"{'balls':>5} {'speed':>6} {'steps':>8} {'step s':>8} {'ff s':>8} {'speedup':>8} {'max |dx|':>10}")
+    for n in args.balls:
+        for speed in args.speeds:
+            a = Simulation(n, w, h, 36, seed=1)
+            b = Simulation(n, w, h, 36, seed=1)
+            t0 = time.perf_counter()
+            for _ in range(steps):
+                a.step(DT, speed)
+            t_step = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            b.fast_forward(steps, DT, speed)
+            t_ff = time.perf_counter() - t0
+            diff = max(np.abs(a.x - b.x).max(), np.abs(a.y - b.y).max())
+            print(f"{n:>5} {speed:6g} {steps:>8} {t_step:8.2f} {t_ff:8.3f} {t_step / t_ff:7.1f}x {diff:10.2e}")
+
+    sim = Simulation(1, 60, 60, 36, seed=1)
+    bounces = []
+    hit = sim.hit
+    sim.hit = lambda idx: (bounces.append(np.size(idx)), hit(idx))
+    for _ in range(600):
+        sim.step(DT, 24 * SPEED_BOOST_MULT)
+    bounces = sum(bounces)
+    print(f"60x60 box, ball 36, speed {24 * SPEED_BOOST_MULT:g}: {bounces / 600:.2f} bounces per step")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""
+Trail benchmark: Tk calls (and time, when a display is available) per frame
+for the old delete-and-recreate trail versus the pooled TrailPool.
+
+    python benchmarks/bench_trail.py [--frames 600] [--trail 30 60 120]
+"""
+
+import argparse, math, time
+
+import common
+from common import CountingCanvas, try_tk_canvas
+from colors import brighten_color, dim_color
+from screen import DEFAULT_BALL_SIZE
+from trail import TrailBuffer, TrailPool
+from render import RenderLayer
+
+
+def motion(frames, speed=8.0):
+    """Yields (prev_x, prev_y, x, y) for a ball bouncing in an 800x600 box."""
+    x, y, dx, dy = 200.0, 240.0, math.cos(0.5), math.sin(0.5)
+    w, h = 800 - DEFAULT_BALL_SIZE, 600 - DEFAULT_BALL_SIZE
+    for _ in range(frames):
+        px, py = x, y
+        x += dx * speed; y += dy * speed
+        if x <= 0 or x >= w: dx = -dx; x = min(max(x, 0), w)
+        if y <= 0 or y >= h: dy = -dy; y = min(max(y, 0), h)
+        yield px, py, x, y
+
+
+def trail_points(px, py, x, y, color):
+    dx = x - px; dy = y - py
+    n = min(12, max(1, int(math.hypot(dx, dy) // 2)))
+    head = brighten_color(color, factor=1.5); mid = brighten_color(color, factor=1.35)
+    pts = [(px + dx * i / (n + 1), py + dy * i / (n + 1), mid if i < n else head) for i in range(1, n + 1)]
+    pts.append((x, y, head))
+    return pts
+
+
+def run_legacy(canvas, frames, maxlen, color='#e0a040'):
+    trail = []
+    size = DEFAULT_BALL_SIZE
+    for px, py, x, y in motion(frames):
+        for p in trail_points(px, py, x, y, color):
+            trail.insert(0, p)
+        if len(trail) > maxlen:
+            trail = trail[:maxlen]
+        canvas.delete('trail')
+        total = len(trail) or 1
+        for idx, (tx, ty, tcol) in enumerate(trail):
+            age = idx / total
+            sz = size * (0.85 - age * 0.6)
+            col = dim_color(tcol, factor=0.45 + (1.0 - age) * 0.55)
+            canvas.create_oval(tx + size/2 - sz/2, ty + size/2 - sz/2, tx + size/2 + sz/2, ty + size/2 + sz/2,
+                               fill=col, outline='', tags='trail')
+
+
+def run_pooled(canvas, frames, maxlen, color='#e0a040'):
+    trail = TrailBuffer(maxlen)
+    pool = TrailPool(RenderLayer(canvas), maxlen)
+    for px, py, x, y in motion(frames):
+        for p in trail_points(px, py, x, y, color):
+            trail.push(*p)
+        pool.draw(trail, 0, 0, DEFAULT_BALL_SIZE)
+
+
+def count_calls(fn, frames, maxlen):
+    canvas = CountingCanvas()
+    fn(canvas, frames, maxlen)
+    return canvas.total() / frames, dict(canvas.calls)
+
+
+def time_tk(fn, root, canvas, frames, maxlen):
+    canvas.delete('all')
+    t0 = time.perf_counter()
+    fn(canvas, frames, maxlen)
+    root.update()
+    return (time.perf_counter() - t0) / frames * 1000.0
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--frames', type=int, default=600)
+    ap.add_argument('--trail', type=int, nargs='+', default=[30, 60, 120])
+    args = ap.parse_args()
+
+    root, tk_canvas = try_tk_canvas()
+    print(f"{'max_trail_len':>13} {'impl':>7} {'tk calls/frame':>15} {'items made/frame':>17} {'ms/frame':>9}  breakdown")
+    for maxlen in args.trail:
+        for name, fn in (('legacy', run_legacy), ('pooled', run_pooled)):
+            per_frame, calls = count_calls(fn, args.frames, maxlen)
+            ms = f"{time_tk(fn, root, tk_canvas, args.frames, maxlen):9.3f}" if root else f"{'n/a':>9}"
+            made = (calls.get('create_oval', 0) - (maxlen if fn is run_pooled else 0)) / args.frames
+            print(f"{maxlen:>13} {name:>7} {per_frame:15.1f} {made:17.1f} {ms}  {calls}")
+    if root is None:
+        print('(no display: timings skipped, run under Xvfb for ms/frame)')
+    else:
+        root.destroy()
+
+
+if __name__ == '__main__':
+    main()
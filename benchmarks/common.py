@@ -0,0 +1,64 @@
+"""
+Shared helpers for the benchmark scripts
+  - makes the repo root importable when a script is run directly
+  - CountingCanvas: Tk-free canvas stand-in that counts calls per method
+"""
+
+import os, sys
+from collections import Counter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+class CountingCanvas:
+    """Accepts the tk.Canvas calls used by zigzag.py and only counts them."""
+
+    def __init__(self):
+        self.calls = Counter()
+        self._next_id = 0
+        self.items = set()
+
+    def _new(self, kind):
+        self.calls[kind] += 1
+        self._next_id += 1
+        self.items.add(self._next_id)
+        return self._next_id
+
+    def create_oval(self, *args, **kw): return self._new('create_oval')
+    def create_rectangle(self, *args, **kw): return self._new('create_rectangle')
+    def create_line(self, *args, **kw): return self._new('create_line')
+    def create_text(self, *args, **kw): return self._new('create_text')
+    def create_image(self, *args, **kw): return self._new('create_image')
+
+    def delete(self, *tags):
+        self.calls['delete'] += 1
+
+    def coords(self, *args):
+        self.calls['coords'] += 1
+
+    def itemconfig(self, *args, **kw):
+        self.calls['itemconfig'] += 1
+
+    def tag_raise(self, *args):
+        self.calls['tag_raise'] += 1
+
+    def total(self):
+        return sum(self.calls.values())
+
+    def reset(self):
+        self.calls.clear()
+
+
+def try_tk_canvas():
+    """Real tk.Canvas when a display is available, otherwise None."""
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+    except Exception:
+        return None, None
+    canvas = tk.Canvas(root, width=800, height=600, highlightthickness=0)
+    canvas.pack()
+    root.update()
+    return root, canvas
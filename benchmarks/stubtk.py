@@ -0,0 +1,144 @@
+"""
+Display-free stand-in for the parts of tkinter that zigzag.py touches.
+
+install() puts it in sys.modules before zigzag is imported, so benchmarks can
+construct a real ZigZagApp without an X server. Canvas calls are counted
+(see common.CountingCanvas) and item bookkeeping is kept, but nothing is drawn:
+timings measure the Python side of a frame only.
+"""
+
+import sys, types
+
+from common import CountingCanvas
+
+
+class Widget:
+    def __init__(self, *args, **kw):
+        self._cfg = dict(kw)
+        self._after = []
+        self._width = kw.get('width', 800)
+        self._height = kw.get('height', 600)
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return lambda *a, **k: None
+
+    def config(self, **kw): self._cfg.update(kw)
+    configure = config
+    def cget(self, key): return self._cfg.get(key)
+
+    def geometry(self, spec=None):
+        if spec:
+            size = spec.split('+')[0]
+            if 'x' in size:
+                w, h = size.split('x')
+                self._width, self._height = int(w), int(h)
+        return f"{self._width}x{self._height}+0+0"
+
+    def winfo_width(self): return self._width
+    def winfo_height(self): return self._height
+    def winfo_screenwidth(self): return self._width
+    def winfo_screenheight(self): return self._height
+    def winfo_x(self): return 0
+    def winfo_y(self): return 0
+    def winfo_exists(self): return True
+    def winfo_ismapped(self): return True
+    def winfo_viewable(self): return True
+
+    def after(self, ms, func=None, *args):
+        root = _root_of(self)
+        root._after_seq = getattr(root, '_after_seq', 0) + 1
+        ident = f"after#{root._after_seq}"
+        root._after.append((ident, func, args))
+        return ident
+
+    def after_idle(self, func, *args):
+        return self.after(0, func, *args)
+
+    def after_cancel(self, ident):
+        root = _root_of(self)
+        root._after = [a for a in root._after if a[0] != ident]
+
+    def run_pending(self, limit=None):
+        """Runs queued after() callbacks (without waiting) until none are left or limit is hit."""
+        n = 0
+        while self._after and (limit is None or n < limit):
+            ident, func, args = self._after.pop(0)
+            func(*args)
+            n += 1
+        return n
+
+
+def _root_of(widget):
+    return getattr(widget, '_root', None) or widget
+
+
+class Tk(Widget):
+    pass
+
+
+class Canvas(Widget, CountingCanvas):
+    def __init__(self, master=None, **kw):
+        Widget.__init__(self, master, **kw)
+        CountingCanvas.__init__(self)
+        self._root = _root_of(master) if master is not None else None
+        self.tags = {}
+
+    def winfo_width(self): return _root_of(self)._width
+    def winfo_height(self): return _root_of(self)._height
+
+    def _new(self, kind, tags=None):
+        iid = CountingCanvas._new(self, kind)
+        self.tags[iid] = (tags,) if isinstance(tags, str) else tuple(tags or ())
+        return iid
+
+    def create_oval(self, *a, **kw): return self._new('create_oval', kw.get('tags'))
+    def create_rectangle(self, *a, **kw): return self._new('create_rectangle', kw.get('tags'))
+    def create_line(self, *a, **kw): return self._new('create_line', kw.get('tags'))
+    def create_text(self, *a, **kw): return self._new('create_text', kw.get('tags'))
+    def create_image(self, *a, **kw): return self._new('create_image', kw.get('tags'))
+
+    def delete(self, *tags):
+        CountingCanvas.delete(self)
+        for tag in tags:
+            if tag == 'all':
+                gone = list(self.items)
+            elif isinstance(tag, int):
+                gone = [tag]
+            else:
+                gone = [i for i in self.items if tag in self.tags.get(i, ())]
+            for i in gone:
+                self.items.discard(i)
+                self.tags.pop(i, None)
+
+    def find_all(self):
+        return tuple(sorted(self.items))
+
+
+class Variable:
+    def __init__(self, master=None, value=None, **kw): self._value = value
+    def get(self): return self._value
+    def set(self, value): self._value = value
+
+
+class PhotoImage(Widget):
+    def width(self): return self._width
+    def height(self): return self._height
+
+
+def install():
+    """Registers the stub as tkinter (+ ttk, filedialog, messagebox) and returns it."""
+    tk = types.ModuleType('tkinter')
+    tk.Tk = Tk; tk.Toplevel = Widget; tk.Frame = Widget; tk.Label = Widget; tk.Canvas = Canvas
+    tk.DoubleVar = tk.BooleanVar = tk.IntVar = tk.StringVar = Variable
+    tk.PhotoImage = PhotoImage
+    tk.TclError = RuntimeError
+    ttk = types.ModuleType('tkinter.ttk')
+    ttk.Button = ttk.Label = ttk.Scale = ttk.Checkbutton = ttk.Combobox = Widget
+    filedialog = types.ModuleType('tkinter.filedialog')
+    messagebox = types.ModuleType('tkinter.messagebox')
+    tk.ttk = ttk; tk.filedialog = filedialog; tk.messagebox = messagebox
+    sys.modules.update({'tkinter': tk, 'tkinter.ttk': ttk,
+                        'tkinter.filedialog': filedialog, 'tkinter.messagebox': messagebox})
+    return tk
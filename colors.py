@@ -0,0 +1,57 @@
+"""
+Colour helpers for zigzag.py (Tk-free, shared with the headless simulation)
+  - quantized_color_random / brighten_color / dim_color: per-call hex arithmetic
+  - bright_lut / dim_ramp / blend_ramp: memoized tables (bounded LRU) so the render loop only looks colours up
+"""
+
+import random
+from functools import lru_cache
+
+# trail age (0 = head, 1 = tail) is quantized to this many dimming levels
+AGE_LEVELS = 32
+# quantized base colours are 9 steps per channel, two bright variants each for the trail
+RAMP_CACHE_SIZE = 2048
+
+
+def quantized_color_random(solid_bright=False, rng=random):
+    steps = [i*32 for i in range(8)]
+    def q():
+        v = rng.choice(steps)
+        return 255 if (v == 224 and rng.random() < 0.25) else v
+    r = q(); g = q(); b = q()
+    if solid_bright:
+        r = min(255, r + 40)
+        g = min(255, g + 40)
+        b = min(255, b + 40)
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+def brighten_color(hex_color, factor=1.4):
+    c = hex_color.lstrip('#')
+    r = int(c[0:2], 16); g = int(c[2:4], 16); b = int(c[4:6], 16)
+    r = min(255, int(r * factor)); g = min(255, int(g * factor)); b = min(255, int(b * factor))
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+def dim_color(hex_color, factor=0.6):
+    c = hex_color.lstrip('#')
+    r = int(c[0:2], 16); g = int(c[2:4], 16); b = int(c[4:6], 16)
+    r = max(0, int(r * factor)); g = max(0, int(g * factor)); b = max(0, int(b * factor))
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+@lru_cache(maxsize=RAMP_CACHE_SIZE)
+def bright_lut(hex_color, factor):
+    return brighten_color(hex_color, factor)
+
+@lru_cache(maxsize=RAMP_CACHE_SIZE)
+def dim_ramp(hex_color):
+    """Trail dimming of hex_color for every age level; index with int(age * AGE_LEVELS)."""
+    return tuple(dim_color(hex_color, factor=0.45 + (1.0 - k / AGE_LEVELS) * 0.55) for k in range(AGE_LEVELS))
+
+@lru_cache(maxsize=RAMP_CACHE_SIZE)
+def blend_ramp(from_color, to_color, steps):
+    """steps colours from from_color to to_color (both ends included) for tweened colour changes."""
+    a = from_color.lstrip('#'); b = to_color.lstrip('#')
+    ca = [int(a[i:i+2], 16) for i in (0, 2, 4)]
+    cb = [int(b[i:i+2], 16) for i in (0, 2, 4)]
+    span = max(1, steps - 1)
+    return tuple('#' + ''.join(f"{round(x + (y - x) * k / span):02x}" for x, y in zip(ca, cb))
+                 for k in range(steps))
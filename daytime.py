@@ -0,0 +1,118 @@
+"""
+Time-of-day schedules for zigzag.py
+  - DailyWindow: a daily [start, end) wall-clock window (may wrap past midnight) that
+    knows its own next transition, so nothing has to poll the clock
+  - DayScheduler: evaluates every window once, then arms a single Tk timer at the earliest
+    upcoming transition and reports all changed states in one callback
+"""
+
+from datetime import datetime, timedelta
+
+# name -> (start, end); 'dark' drives the theme, 'silent' the silent mode
+DEFAULT_SCHEDULES = {
+    'dark': ('18:00', '06:00'),
+    'silent': ('22:00', '06:00'),
+}
+# re-check at least this often so suspend/resume or a clock change is noticed eventually
+MAX_SLEEP = 15 * 60.0
+
+
+def parse_hhmm(value):
+    """'22:00' / '6:30' / 22 -> minutes after midnight."""
+    if isinstance(value, (int, float)):
+        return int(value * 60) % 1440
+    hh, _, mm = str(value).partition(':')
+    return (int(hh) * 60 + int(mm or 0)) % 1440
+
+
+class DailyWindow:
+    def __init__(self, start, end):
+        self.start = parse_hhmm(start)
+        self.end = parse_hhmm(end)
+
+    @classmethod
+    def from_config(cls, spec):
+        """Accepts {'start': '22:00', 'end': '06:00'}, ['22:00', '06:00'] or None (never active)."""
+        if spec is None:
+            return None
+        if isinstance(spec, dict):
+            return cls(spec['start'], spec['end'])
+        start, end = spec
+        return cls(start, end)
+
+    def to_config(self):
+        return {'start': '%02d:%02d' % divmod(self.start, 60), 'end': '%02d:%02d' % divmod(self.end, 60)}
+
+    def active(self, now):
+        m = now.hour * 60 + now.minute
+        if self.start <= self.end:
+            return self.start <= m < self.end
+        return m >= self.start or m < self.end
+
+    def next_change(self, now):
+        if self.start == self.end:
+            return None
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        candidates = []
+        for day in (0, 1):
+            for m in (self.start, self.end):
+                # replace() keeps wall-clock time right across DST changes
+                t = (midnight + timedelta(days=day)).replace(hour=m // 60, minute=m % 60)
+                if t > now:
+                    candidates.append(t)
+        return min(candidates)
+
+
+class DayScheduler:
+    def __init__(self, widget, windows, callback, clock=datetime.now):
+        self.widget = widget
+        self.callback = callback
+        self.clock = clock
+        self.after_id = None
+        self.running = False
+        self.windows = dict(windows)
+        self.states = self.evaluate(self.clock())
+        self.next_at = None
+
+    def evaluate(self, now):
+        return {name: bool(w is not None and w.active(now)) for name, w in self.windows.items()}
+
+    def set_windows(self, windows):
+        self.windows = dict(windows)
+        if self.after_id is not None:
+            self.widget.after_cancel(self.after_id)
+            self.after_id = None
+        self._fire()
+
+    def start(self):
+        self.stop()
+        self.running = True
+        self._arm(self.clock())
+
+    def stop(self):
+        self.running = False
+        if self.after_id is not None:
+            try: self.widget.after_cancel(self.after_id)
+            except Exception: pass
+            self.after_id = None
+
+    def _arm(self, now):
+        changes = [w.next_change(now) for w in self.windows.values() if w is not None]
+        changes = [t for t in changes if t is not None]
+        self.next_at = min(changes) if changes else None
+        delay = MAX_SLEEP if self.next_at is None else min(MAX_SLEEP, (self.next_at - now).total_seconds())
+        # +50 ms so the timer lands just past the boundary, not a hair before it
+        self.after_id = self.widget.after(max(0, int(delay * 1000.0)) + 50, self._fire)
+
+    def _fire(self):
+        self.after_id = None
+        now = self.clock()
+        states = self.evaluate(now)
+        changed = {k: v for k, v in states.items() if self.states.get(k) != v}
+        self.states = states
+        try:
+            if changed:
+                self.callback(changed)
+        finally:
+            if self.running:
+                self._arm(now)
@@ -0,0 +1,187 @@
+"""
+Offline export of the idle screen (no display needed)
+  - Runs the same Simulation, trail, border and scanline logic as ZigZagApp for N frames
+    on a fixed timestep, so the output only depends on the seed and the options
+  - Frames are rasterized into NumPy RGB buffers and encoded in a process pool:
+    a PNG sequence (zlib only) or an animated GIF (needs Pillow)
+  - Text overlays (collision phrases, silent mode, HUD) are not drawn
+
+    python export.py --seed 7 --frames 600 --out loop/             # loop/frame_000000.png ...
+    python export.py --seed 7 --frames 300 --fps 30 --out loop.gif --workers 8
+"""
+
+import argparse, itertools, os, struct, sys, time, zlib
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+from simulation import Simulation
+from scheduler import FixedTimestep
+from trail import TrailBuffer, slot_layout
+from colors import dim_ramp
+from framebuffer import hex_rgb, packed_rgb, draw_discs
+from screen import (frame_rects, THEMES, DEFAULT_BALL_SIZE, DEFAULT_BASE_SPEED, SCANLINE_STEP,
+                    SCANLINE_COLOR, TRAIL_MAX)
+from governor import QUALITY_LEVELS
+
+CHUNK_FRAMES = 8
+
+
+_backgrounds = {}
+
+def background(w, h, theme, scan_step):
+    """Borders, content and scanlines; built once per worker and copied for every frame."""
+    key = (w, h, theme, scan_step)
+    bg = _backgrounds.get(key)
+    if bg is None:
+        bg = np.zeros((h, w, 3), dtype=np.uint8)
+        (x0, y0, x1, y1), rects = frame_rects(w, h)
+        for (rx0, ry0, rx1, ry1), color in zip(rects, THEMES[theme]):
+            bg[ry0:ry1, rx0:rx1] = hex_rgb(color)
+        if scan_step:
+            bg[y0:y1:scan_step, x0:x1] = hex_rgb(SCANLINE_COLOR)
+        _backgrounds[key] = bg
+    return bg
+
+
+def rasterize(job):
+    """One frame as an (h, w, 3) uint8 array; job comes from simulate()."""
+    frame, w, h, theme, scan_step, ball_size, balls, colors, trail = job
+    buf = background(w, h, theme, scan_step).copy()
+    half = ball_size / 2
+    draw_discs(buf, balls[:, 0] + half, balls[:, 1] + half, np.full(len(balls), half), packed_rgb(colors))
+    # the canvas stacks trail above balls, and later (older) slots above earlier ones
+    if trail:
+        cx, cy, r, color = zip(*trail)
+        draw_discs(buf, cx, cy, r, [hex_rgb(c) for c in color])
+    return buf
+
+
+def encode_png(rgb):
+    h, w = rgb.shape[:2]
+    raw = np.empty((h, w * 3 + 1), dtype=np.uint8)
+    raw[:, 0] = 0   # filter type None for every row
+    raw[:, 1:] = rgb.reshape(h, w * 3)
+    def chunk(tag, data):
+        return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data) & 0xffffffff)
+    return (b'\x89PNG\r\n\x1a\n' +
+            chunk(b'IHDR', struct.pack('>IIBBBBB', w, h, 8, 2, 0, 0, 0)) +
+            chunk(b'IDAT', zlib.compress(raw.tobytes(), 6)) +
+            chunk(b'IEND', b''))
+
+
+def render_png(args):
+    job, path = args
+    with open(path, 'wb') as f:
+        f.write(encode_png(rasterize(job)))
+    return path
+
+
+def render_gif_frame(job):
+    img = Image.fromarray(rasterize(job)).quantize(256, method=Image.Quantize.MEDIANCUT, dither=Image.Dither.NONE)
+    return img.tobytes(), img.getpalette()
+
+
+def simulate(frames, width, height, seed, fps=60, speed=DEFAULT_BASE_SPEED, ball_size=DEFAULT_BALL_SIZE,
+             ball_count=1, ball_collisions=False, show_trail=True, show_scanlines=True, theme='light',
+             silent=False, trail_len=TRAIL_MAX):
+    """Yields one render job per frame, stepping the simulation exactly like ZigZagApp._animate_loop.
+    frames=None keeps going forever (streaming)."""
+    (x0, y0, x1, y1), _ = frame_rects(width, height)
+    sim = Simulation(ball_count, x1 - x0, y1 - y0, ball_size, seed=seed, ball_collisions=ball_collisions)
+    timestep = FixedTimestep()
+    timestep.reset(0.0)
+    trail = TrailBuffer(trail_len)
+    interp_cap = QUALITY_LEVELS[0].interp_cap
+    scan_step = SCANLINE_STEP if show_scanlines else 0
+    half = ball_size / 2
+    trail_from = None
+    for frame in (range(frames) if frames is not None else itertools.count()):
+        for _ in range(timestep.advance((frame + 1) / fps)):
+            sim.step(timestep.step, speed, silent)
+        rx, ry = sim.interpolate(timestep.alpha)
+        head_x = float(rx[0]); head_y = float(ry[0])
+        prev_x, prev_y = trail_from or (head_x, head_y)
+        trail_from = (head_x, head_y)
+        items = []
+        if show_trail:
+            trail.push_segment(prev_x, prev_y, head_x, head_y, sim.color_hex(0), interp_cap)
+            layout = slot_layout(len(trail) or 1, ball_size)
+            for (tx, ty, tcol), (r, level) in zip(trail, layout):
+                items.append((x0 + tx + half, y0 + ty + half, r, dim_ramp(tcol)[level]))
+        balls = np.column_stack((rx + x0, ry + y0))
+        yield (frame, width, height, theme, scan_step, ball_size, balls, sim.color.copy(), items)
+
+
+def export(out, frames, width=800, height=600, seed=0, fps=60, fmt=None, workers=None, **options):
+    """Renders frames to a PNG sequence (out is a directory) or an animated GIF (out ends in .gif)."""
+    fmt = fmt or ('gif' if out.lower().endswith('.gif') else 'png')
+    if fmt == 'gif' and Image is None:
+        raise RuntimeError('GIF export needs Pillow (pip install pillow); PNG sequences do not')
+    workers = workers or os.cpu_count() or 1
+    jobs = simulate(frames, width, height, seed, fps=fps, **options)
+
+    with ProcessPoolExecutor(workers) if workers > 1 else _Inline() as pool:
+        if fmt == 'png':
+            os.makedirs(out, exist_ok=True)
+            tasks = ((job, os.path.join(out, f'frame_{job[0]:06d}.png')) for job in jobs)
+            return list(pool.map(render_png, tasks, chunksize=CHUNK_FRAMES))
+        images = []
+        for data, palette in pool.map(render_gif_frame, jobs, chunksize=CHUNK_FRAMES):
+            img = Image.frombytes('P', (width, height), data)
+            img.putpalette(palette)
+            images.append(img)
+    images[0].save(out, save_all=True, append_images=images[1:], duration=round(1000 / fps), loop=0,
+                   optimize=False, disposal=1)
+    return [out]
+
+
+class _Inline:
+    """Stand-in for the pool with workers=1: same map(), no processes."""
+    def __enter__(self): return self
+    def __exit__(self, *exc): return False
+    def map(self, fn, items, chunksize=1): return map(fn, items)
+
+
+def parse_args(argv=None):
+    ap = argparse.ArgumentParser(description='Export the idle screen to a PNG sequence or animated GIF')
+    ap.add_argument('--out', required=True, help='output directory (PNG) or file.gif')
+    ap.add_argument('--frames', type=int, default=300)
+    ap.add_argument('--seed', type=int, default=0)
+    ap.add_argument('--fps', type=int, default=60)
+    ap.add_argument('--size', default='800x600', help='canvas size WxH')
+    ap.add_argument('--format', choices=('png', 'gif'), default=None, help='default: from --out')
+    ap.add_argument('--workers', type=int, default=None, help='encoder processes (default: all cores)')
+    ap.add_argument('--speed', type=float, default=DEFAULT_BASE_SPEED)
+    ap.add_argument('--balls', type=int, default=1)
+    ap.add_argument('--ball-collisions', action='store_true')
+    ap.add_argument('--theme', choices=sorted(THEMES), default='light')
+    ap.add_argument('--silent', action='store_true', help='silent-mode speed')
+    ap.add_argument('--no-trail', action='store_true')
+    ap.add_argument('--no-scanlines', action='store_true')
+    return ap.parse_args(argv)
+
+
+def main():
+    args = parse_args()
+    w, h = (int(v) for v in args.size.lower().split('x'))
+    t0 = time.perf_counter()
+    try:
+        written = export(args.out, args.frames, w, h, seed=args.seed, fps=args.fps, fmt=args.format,
+                         workers=args.workers, speed=args.speed, ball_count=args.balls,
+                         ball_collisions=args.ball_collisions, theme=args.theme, silent=args.silent,
+                         show_trail=not args.no_trail, show_scanlines=not args.no_scanlines)
+    except RuntimeError as e:
+        sys.exit(str(e))
+    elapsed = time.perf_counter() - t0
+    print(f'{args.frames} frames -> {args.out} ({len(written)} files) in {elapsed:.2f}s, '
+          f'{args.frames / elapsed:.1f} frames/s')
+
+
+if __name__ == '__main__':
+    main()
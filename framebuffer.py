@@ -0,0 +1,123 @@
+"""
+NumPy software framebuffer for zigzag.py (alternative to one canvas item per shape)
+  - The content area is composited into an (h, w, 3) uint8 array: a cached background
+    (content colour + scanlines), then balls and trail as vectorized disc fills
+  - Optional CRT effects (vignette, curvature) from per-size precomputed maps
+  - ppm() gives the frame as PPM bytes for a single tk.PhotoImage blit; no Tk imports here
+"""
+
+from collections import OrderedDict
+from functools import lru_cache
+
+import numpy as np
+
+CRT_EFFECTS = ('vignette', 'curvature')
+BACKGROUND_CACHE_SIZE = 4
+VIGNETTE_STRENGTH = 0.45
+CURVATURE = 0.08
+
+
+@lru_cache(maxsize=4096)
+def hex_rgb(color):
+    c = color.lstrip('#')
+    return int(c[0:2], 16), int(c[2:4], 16), int(c[4:6], 16)
+
+
+def packed_rgb(colors):
+    """uint32 0xRRGGBB array (Simulation.color) -> (n, 3) uint8."""
+    colors = np.asarray(colors, dtype=np.uint32)
+    return np.stack(((colors >> 16) & 255, (colors >> 8) & 255, colors & 255), axis=1).astype(np.uint8)
+
+
+def draw_discs(buf, cx, cy, r, rgb):
+    """Fills n discs at once, later discs on top (like later canvas items); rgb is (n, 3)."""
+    cx = np.asarray(cx, dtype=float); cy = np.asarray(cy, dtype=float); r = np.asarray(r, dtype=float)
+    if not cx.size:
+        return
+    h, w = buf.shape[:2]
+    off = np.arange(int(np.ceil(r.max() * 2)) + 2)
+    xs = np.floor(cx - r).astype(np.intp)[:, None] + off
+    ys = np.floor(cy - r).astype(np.intp)[:, None] + off
+    dx = (xs + 0.5 - cx[:, None]) ** 2
+    dy = (ys + 0.5 - cy[:, None]) ** 2
+    inside = dy[:, :, None] + dx[:, None, :] <= (r * r)[:, None, None]
+    inside &= ((ys >= 0) & (ys < h))[:, :, None] & ((xs >= 0) & (xs < w))[:, None, :]
+    # nonzero() walks disc by disc, so overlapping pixels end up with the last disc's colour
+    k, iy, ix = np.nonzero(inside)
+    buf[ys[k, iy], xs[k, ix]] = np.asarray(rgb, dtype=np.uint8)[k]
+
+
+@lru_cache(maxsize=4)
+def vignette_gain(w, h, strength=VIGNETTE_STRENGTH):
+    """(h, w, 1) uint16 gain in 1/256 units, darker towards the corners."""
+    u = np.linspace(-1.0, 1.0, w)[None, :]
+    v = np.linspace(-1.0, 1.0, h)[:, None]
+    gain = 1.0 - strength * np.clip((u * u + v * v) / 2.0, 0.0, 1.0) ** 1.5
+    return np.round(gain * 256).astype(np.uint16)[:, :, None]
+
+
+@lru_cache(maxsize=4)
+def curvature_map(w, h, k=CURVATURE):
+    """Flat source pixel per output pixel for a barrel distortion; off-tube pixels point at w*h (black)."""
+    u = np.linspace(-1.0, 1.0, w)[None, :]
+    v = np.linspace(-1.0, 1.0, h)[:, None]
+    # edge midpoints map onto the edges, the corners fall off the tube and stay black
+    scale = (1.0 + k * (u * u + v * v)) / (1.0 + k)
+    su = u * scale
+    sv = v * scale
+    sx = np.round((su + 1.0) / 2.0 * (w - 1)).astype(np.intp)
+    sy = np.round((sv + 1.0) / 2.0 * (h - 1)).astype(np.intp)
+    outside = (sx < 0) | (sx >= w) | (sy < 0) | (sy >= h)
+    return np.where(outside, w * h, sy * w + sx).ravel()
+
+
+class Framebuffer:
+    def __init__(self, width, height, effects=()):
+        self.effects = tuple(e for e in effects if e in CRT_EFFECTS)
+        self.backgrounds = OrderedDict()
+        self.resize(width, height)
+
+    def resize(self, width, height):
+        self.width = max(1, int(width))
+        self.height = max(1, int(height))
+        # one extra black pixel past the end is the curvature map's off-tube source
+        self._pixels = np.zeros((self.height * self.width + 1, 3), dtype=np.uint8)
+        self.buf = self._pixels[:-1].reshape(self.height, self.width, 3)
+        self._wide = np.empty((self.height, self.width, 3), dtype=np.uint16)
+
+    def _background(self, color, scan_step, scan_color):
+        key = (self.width, self.height, color, scan_step, scan_color)
+        bg = self.backgrounds.get(key)
+        if bg is not None:
+            self.backgrounds.move_to_end(key)
+            return bg
+        bg = np.empty((self.height, self.width, 3), dtype=np.uint8)
+        bg[:] = hex_rgb(color)
+        if scan_step:
+            bg[::scan_step] = hex_rgb(scan_color)
+        self.backgrounds[key] = bg
+        while len(self.backgrounds) > BACKGROUND_CACHE_SIZE:
+            self.backgrounds.popitem(last=False)
+        return bg
+
+    def clear(self, color, scan_step=0, scan_color='#000000'):
+        np.copyto(self.buf, self._background(color, scan_step, scan_color))
+
+    def discs(self, cx, cy, r, rgb):
+        draw_discs(self.buf, cx, cy, r, rgb)
+
+    def output(self):
+        out = self.buf
+        if 'curvature' in self.effects:
+            # gather whole 3-byte pixels in one take()
+            pixels = self._pixels.view('V3').ravel()
+            out = pixels.take(curvature_map(self.width, self.height)).view(np.uint8).reshape(out.shape)
+        if 'vignette' in self.effects:
+            wide = self._wide
+            np.multiply(out, vignette_gain(self.width, self.height), out=wide)
+            wide >>= 8
+            out = wide.astype(np.uint8)
+        return out
+
+    def ppm(self):
+        return b'P6 %d %d 255\n' % (self.width, self.height) + self.output().tobytes()
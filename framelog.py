@@ -0,0 +1,144 @@
+"""
+Frame metadata log for zigzag.py
+  - FrameLogWriter: background thread fed by a bounded queue; appends JSONL records
+    to one segmented log with size-based rotation and flushes in batches
+    (every BATCH_SIZE records or FLUSH_INTERVAL seconds, whichever comes first).
+    log() never blocks: when the queue is full the record is dropped and counted.
+  - iter_records / iter_log: memory-map a segment (or every segment) and iterate its records
+"""
+
+import json, mmap, os, queue, threading, time
+
+SEGMENT_PREFIX = 'frames-'
+SEGMENT_SUFFIX = '.jsonl'
+SEGMENT_BYTES = 1 << 20
+MAX_SEGMENTS = 8
+QUEUE_SIZE = 256
+BATCH_SIZE = 64
+FLUSH_INTERVAL = 1.0
+
+_STOP = object()
+
+
+def segment_paths(directory):
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return []
+    names = sorted(n for n in names if n.startswith(SEGMENT_PREFIX) and n.endswith(SEGMENT_SUFFIX))
+    return [os.path.join(directory, n) for n in names]
+
+
+def iter_records(path):
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = 0
+            size = mm.size()
+            while pos < size:
+                end = mm.find(b'\n', pos)
+                if end < 0:
+                    break  # partial last line from an interrupted write
+                line = mm[pos:end]
+                pos = end + 1
+                if line:
+                    yield json.loads(line)
+
+
+def iter_log(directory):
+    for path in segment_paths(directory):
+        yield from iter_records(path)
+
+
+class FrameLogWriter:
+    def __init__(self, directory, segment_bytes=SEGMENT_BYTES, max_segments=MAX_SEGMENTS,
+                 queue_size=QUEUE_SIZE, batch_size=BATCH_SIZE, flush_interval=FLUSH_INTERVAL):
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.max_segments = max(1, max_segments)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.dropped = 0
+        self.written = 0
+        self._file = None
+        self._thread = threading.Thread(target=self._run, name='frame-log', daemon=True)
+        self._thread.start()
+
+    def log(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self, timeout=2.0):
+        if not self._thread.is_alive():
+            return
+        try:
+            self.queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            # the writer is stuck: give up the oldest record so the stop marker fits
+            try:
+                self.queue.get_nowait()
+                self.dropped += 1
+            except queue.Empty:
+                pass
+            try: self.queue.put_nowait(_STOP)
+            except queue.Full: pass
+        self._thread.join(timeout)
+
+    def _open_segment(self):
+        os.makedirs(self.directory, exist_ok=True)
+        paths = segment_paths(self.directory)
+        index = 0
+        if paths:
+            last = os.path.basename(paths[-1])
+            index = int(last[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)])
+            if os.path.getsize(paths[-1]) >= self.segment_bytes:
+                index += 1
+        path = os.path.join(self.directory, f"{SEGMENT_PREFIX}{index:06d}{SEGMENT_SUFFIX}")
+        self._file = open(path, 'ab')
+        for old in segment_paths(self.directory)[:-self.max_segments]:
+            try: os.remove(old)
+            except OSError: pass
+
+    def _write_batch(self, batch):
+        data = b''.join(json.dumps(r, separators=(',', ':')).encode('utf-8') + b'\n' for r in batch)
+        if self._file is None or self._file.tell() >= self.segment_bytes:
+            if self._file is not None:
+                self._file.close()
+            self._open_segment()
+        self._file.write(data)
+        self._file.flush()
+        self.written += len(batch)
+
+    def _flush(self, batch):
+        try:
+            self._write_batch(batch)
+        except Exception as e:
+            print('Frame log error:', e)
+
+    def _run(self):
+        batch = []
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            if item is _STOP:
+                break
+            if item is not None:
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+            if batch and (len(batch) >= self.batch_size or time.monotonic() >= deadline):
+                self._flush(batch)
+                batch = []
+                deadline = None
+        if batch:
+            self._flush(batch)
+        if self._file is not None:
+            self._file.close()
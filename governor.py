@@ -0,0 +1,91 @@
+"""
+Adaptive quality governor for zigzag.py
+  - Watches frame cost (loop work + how late the frame started) over a window of frames
+  - Steps down one QUALITY_LEVELS entry when the p90 misses the budget, back up when the
+    p90 stays under UP_RATIO of the budget; a cooldown after every change gives hysteresis
+  - Never goes below the configured floor: the cheapest level it may use, given as an index
+    into QUALITY_LEVELS (0 = full quality, higher = cheaper) or as a name from QUALITY_NAMES
+"""
+
+from collections import deque, namedtuple
+
+Quality = namedtuple('Quality', 'interp_cap trail_frac scan_mult dim_levels')
+
+# level 0 is full quality (the defaults of zigzag.py); higher levels are cheaper
+QUALITY_LEVELS = (
+    Quality(12, 1.0, 1, 32),
+    Quality(8, 0.8, 1, 16),
+    Quality(6, 0.6, 2, 8),
+    Quality(4, 0.4, 3, 4),
+    Quality(2, 0.25, 4, 2),
+)
+QUALITY_NAMES = ('full', 'high', 'medium', 'low', 'minimal')
+
+WINDOW = 30
+DOWN_RATIO = 1.0
+UP_RATIO = 0.6
+COOLDOWN_FRAMES = 120
+
+
+def quality_level(value):
+    """QUALITY_LEVELS index for an index or a QUALITY_NAMES name (config files may use either)."""
+    if isinstance(value, str) and not value.strip().isdigit():
+        try:
+            return QUALITY_NAMES.index(value.strip().lower())
+        except ValueError:
+            raise ValueError(f"unknown quality level {value!r}, expected one of {', '.join(QUALITY_NAMES)}")
+    return max(0, min(int(value), len(QUALITY_LEVELS) - 1))
+
+
+class QualityGovernor:
+    def __init__(self, budget_ms, floor=len(QUALITY_LEVELS) - 1, window=WINDOW,
+                 down_ratio=DOWN_RATIO, up_ratio=UP_RATIO, cooldown=COOLDOWN_FRAMES):
+        self.budget_ms = budget_ms
+        self.floor = quality_level(floor)
+        self.down_ratio = down_ratio
+        self.up_ratio = up_ratio
+        self.cooldown = cooldown
+        self.samples = deque(maxlen=window)
+        self.level = 0
+        self.hold = 0
+        self.last_decision = ''
+
+    @property
+    def quality(self):
+        return QUALITY_LEVELS[self.level]
+
+    def p90(self):
+        ordered = sorted(self.samples)
+        return ordered[int(len(ordered) * 0.9)] if ordered else 0.0
+
+    def sample(self, frame_ms):
+        """Feeds one frame cost; returns the new level when it changes, else None."""
+        self.samples.append(frame_ms)
+        if self.hold > 0:
+            self.hold -= 1
+            return None
+        if len(self.samples) < self.samples.maxlen:
+            return None
+        p90 = self.p90()
+        if p90 > self.budget_ms * self.down_ratio and self.level < self.floor:
+            self.level += 1
+            self.last_decision = f"Q{self.level}v p90 {p90:.1f}>{self.budget_ms:.1f}ms"
+        elif p90 < self.budget_ms * self.up_ratio and self.level > 0:
+            self.level -= 1
+            self.last_decision = f"Q{self.level}^ p90 {p90:.1f}ms"
+        else:
+            return None
+        self.samples.clear()
+        self.hold = self.cooldown
+        return self.level
+
+    def set_budget(self, budget_ms):
+        self.budget_ms = budget_ms
+        self.samples.clear()
+
+    def set_floor(self, floor):
+        self.floor = quality_level(floor)
+        if self.level > self.floor:
+            self.level = self.floor
+            return self.level
+        return None
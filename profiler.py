@@ -0,0 +1,106 @@
+"""
+Per-stage frame profiler for zigzag.py
+  - begin() / lap(stage) / end() around the stages of one frame; each call is a
+    single flag check while profiling is off
+  - rolling per-stage averages and a frame-time histogram over the last WINDOW frames
+  - export() writes totals, rolling averages and the histogram as JSON
+"""
+
+import json, time
+from collections import deque
+
+WINDOW = 120
+# upper bounds (ms) of the frame-time histogram buckets; the last bucket is open-ended
+HIST_BOUNDS = (2.0, 4.0, 8.0, 16.7, 33.3)
+HIST_BARS = ' ▁▂▃▄▅▆▇█'
+
+
+class StageProfiler:
+    def __init__(self, stages, window=WINDOW):
+        self.stages = tuple(stages)
+        self.window = window
+        self.enabled = False
+        self.reset()
+
+    def reset(self):
+        self.recent = {s: deque(maxlen=self.window) for s in self.stages}
+        self.frame_times = deque(maxlen=self.window)
+        self.totals = dict.fromkeys(self.stages, 0.0)
+        self.frames = 0
+        self._current = dict.fromkeys(self.stages, 0.0)
+        self._t0 = self._t = 0.0
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        if self.enabled:
+            self.reset()
+        return self.enabled
+
+    def begin(self):
+        if not self.enabled:
+            return
+        self._t0 = self._t = time.perf_counter()
+        current = self._current
+        for s in current:
+            current[s] = 0.0
+
+    def lap(self, stage):
+        if not self.enabled or not self._t0:
+            return
+        t = time.perf_counter()
+        self._current[stage] += t - self._t
+        self._t = t
+
+    def end(self):
+        if not self.enabled or not self._t0:
+            return
+        t = time.perf_counter()
+        for s, v in self._current.items():
+            self.recent[s].append(v)
+            self.totals[s] += v
+        self.frame_times.append(t - self._t0)
+        self.frames += 1
+        self._t0 = 0.0
+
+    def averages_ms(self):
+        return {s: (sum(v) / len(v) * 1000.0 if v else 0.0) for s, v in self.recent.items()}
+
+    def frame_ms(self):
+        return sum(self.frame_times) / len(self.frame_times) * 1000.0 if self.frame_times else 0.0
+
+    def histogram(self):
+        counts = [0] * (len(HIST_BOUNDS) + 1)
+        for ft in self.frame_times:
+            ms = ft * 1000.0
+            for i, bound in enumerate(HIST_BOUNDS):
+                if ms < bound:
+                    counts[i] += 1
+                    break
+            else:
+                counts[-1] += 1
+        return counts
+
+    def hud_text(self):
+        lines = [f"{'frame':<10}{self.frame_ms():7.2f} ms"]
+        for s, ms in self.averages_ms().items():
+            lines.append(f"{s:<10}{ms:7.2f} ms")
+        counts = self.histogram()
+        peak = max(counts) or 1
+        bars = ''.join(HIST_BARS[round(c / peak * (len(HIST_BARS) - 1))] for c in counts)
+        labels = [f"<{b:g}" for b in HIST_BOUNDS] + [f">{HIST_BOUNDS[-1]:g}"]
+        lines.append(f"hist [{bars}] {' '.join(labels)}")
+        return '\n'.join(lines)
+
+    def export(self, path):
+        data = {
+            'frames': self.frames,
+            'window': self.window,
+            'totals_ms': {s: v * 1000.0 for s, v in self.totals.items()},
+            'mean_ms': {s: (v / self.frames * 1000.0 if self.frames else 0.0) for s, v in self.totals.items()},
+            'rolling_ms': self.averages_ms(),
+            'rolling_frame_ms': self.frame_ms(),
+            'histogram': {'bounds_ms': list(HIST_BOUNDS), 'counts': self.histogram()},
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        return path
@@ -0,0 +1,81 @@
+"""
+Change-tracking render layer for zigzag.py
+  - Wraps a tk.Canvas with the same create_*/coords/itemconfig/delete calls
+  - Remembers the last coords and option values sent for every item (and widget)
+    and only submits what actually changed; skipped calls are counted
+"""
+
+
+class RenderLayer:
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self._coords = {}
+        self._opts = {}
+        self.sent = 0
+        self.skipped = 0
+
+    def _create(self, factory, coords, opts):
+        iid = factory(*coords, **opts)
+        self.sent += 1
+        self._coords[iid] = tuple(coords)
+        self._opts[iid] = dict(opts)
+        return iid
+
+    def create_oval(self, *coords, **opts): return self._create(self.canvas.create_oval, coords, opts)
+    def create_rectangle(self, *coords, **opts): return self._create(self.canvas.create_rectangle, coords, opts)
+    def create_line(self, *coords, **opts): return self._create(self.canvas.create_line, coords, opts)
+    def create_text(self, *coords, **opts): return self._create(self.canvas.create_text, coords, opts)
+    def create_image(self, *coords, **opts): return self._create(self.canvas.create_image, coords, opts)
+
+    def coords(self, iid, *coords):
+        if not coords:
+            return self.canvas.coords(iid)
+        if self._coords.get(iid) == coords:
+            self.skipped += 1
+            return
+        self.canvas.coords(iid, *coords)
+        self.sent += 1
+        self._coords[iid] = coords
+
+    def itemconfig(self, iid, **opts):
+        last = self._opts.setdefault(iid, {})
+        changed = {k: v for k, v in opts.items() if k not in last or last[k] != v}
+        if not changed:
+            self.skipped += 1
+            return
+        self.canvas.itemconfig(iid, **changed)
+        self.sent += 1
+        last.update(changed)
+
+    def config(self, widget, **opts):
+        """itemconfig for a plain widget (e.g. a Label), tracked under the widget itself."""
+        last = self._opts.setdefault(widget, {})
+        changed = {k: v for k, v in opts.items() if k not in last or last[k] != v}
+        if not changed:
+            self.skipped += 1
+            return
+        widget.config(**changed)
+        self.sent += 1
+        last.update(changed)
+
+    def delete(self, *items):
+        self.canvas.delete(*items)
+        self.sent += 1
+        for item in items:
+            if isinstance(item, int):
+                self._coords.pop(item, None)
+                self._opts.pop(item, None)
+            else:
+                # a tag can match anything: forget every canvas item
+                self._coords.clear()
+                self._opts = {k: v for k, v in self._opts.items() if not isinstance(k, int)}
+
+    def tag_raise(self, *args):
+        self.canvas.tag_raise(*args)
+        self.sent += 1
+
+    def bbox(self, *args):
+        return self.canvas.bbox(*args)
+
+    def stats(self):
+        return self.sent, self.skipped
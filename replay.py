@@ -0,0 +1,159 @@
+"""
+Deterministic record / replay for zigzag.py
+  - Recorder: writes the simulation seed and setup, then every input to a step
+    (dt, speed slider changes, silent mode changes, resizes, ball size and
+    ball-collision changes)
+    as compact JSON lines, plus a full-state keyframe every KEYFRAME_INTERVAL frames
+  - Replay: loads a recording, re-runs it step by step and seeks to any frame by
+    restoring the nearest earlier keyframe and re-simulating forward from there
+"""
+
+import bisect, json
+
+from simulation import Simulation
+
+KEYFRAME_INTERVAL = 300
+
+# event tags, one JSON array per line: [tag, ...]
+EV_HEADER = 'h'     # ['h', {seed, count, width, height, ball_size, ball_collisions}]
+EV_STEP = 'd'       # ['d', dt]
+EV_SPEED = 'v'      # ['v', base_speed]
+EV_SILENT = 's'     # ['s', silent]
+EV_RESIZE = 'r'     # ['r', width, height]
+EV_BALL_SIZE = 'b'  # ['b', ball_size]
+EV_COLLISIONS = 'c' # ['c', ball_collisions]
+EV_KEYFRAME = 'k'   # ['k', frame, {frame, pos, dir, color, speed, silent, state}]
+
+
+class Recorder:
+    def __init__(self, path, sim, seed, keyframe_interval=KEYFRAME_INTERVAL):
+        self.file = open(path, 'w', encoding='utf-8')
+        self.sim = sim
+        self.keyframe_interval = max(1, keyframe_interval)
+        self.frame = 0
+        self.speed = None
+        self.silent = None
+        self.size = (sim.width, sim.height)
+        self.ball_size = sim.ball_size
+        self.ball_collisions = sim.ball_collisions
+        self._write([EV_HEADER, {
+            'seed': seed, 'count': sim.count, 'width': sim.width, 'height': sim.height,
+            'ball_size': sim.ball_size, 'ball_collisions': sim.ball_collisions,
+        }])
+
+    def _write(self, event):
+        self.file.write(json.dumps(event, separators=(',', ':')))
+        self.file.write('\n')
+
+    def _keyframe(self):
+        sim = self.sim
+        self._write([EV_KEYFRAME, self.frame, {
+            'frame': self.frame,
+            'pos': [float(sim.x[0]), float(sim.y[0])],
+            'dir': [float(sim.dir_x[0]), float(sim.dir_y[0])],
+            'color': sim.color_hex(0),
+            'speed': self.speed, 'silent': self.silent,
+            'state': sim.snapshot(),
+        }])
+
+    def resize(self, width, height):
+        if (width, height) != self.size:
+            self.size = (width, height)
+            self._write([EV_RESIZE, width, height])
+
+    def set_ball_size(self, ball_size):
+        if ball_size != self.ball_size:
+            self.ball_size = ball_size
+            self._write([EV_BALL_SIZE, ball_size])
+
+    def set_ball_collisions(self, ball_collisions):
+        if ball_collisions != self.ball_collisions:
+            self.ball_collisions = ball_collisions
+            self._write([EV_COLLISIONS, ball_collisions])
+
+    def step(self, dt, base_speed, silent):
+        """Records the inputs of the step about to run; call right before Simulation.step."""
+        if self.frame % self.keyframe_interval == 0:
+            self._keyframe()
+        if base_speed != self.speed:
+            self.speed = base_speed
+            self._write([EV_SPEED, base_speed])
+        if silent != self.silent:
+            self.silent = silent
+            self._write([EV_SILENT, silent])
+        self._write([EV_STEP, dt])
+        self.frame += 1
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
+
+
+class Replay:
+    def __init__(self, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            self.events = [json.loads(line) for line in f if line.strip()]
+        if not self.events or self.events[0][0] != EV_HEADER:
+            raise ValueError(f'{path}: not a zigzag recording')
+        self.header = h = self.events[0][1]
+        self.sim = Simulation(h['count'], h['width'], h['height'], h['ball_size'], seed=h['seed'],
+                              ball_collisions=h['ball_collisions'])
+        self.initial = self.sim.snapshot()
+        self.keyframes = []   # (frame, event index), ascending
+        self.frames = 0
+        for i, ev in enumerate(self.events):
+            if ev[0] == EV_KEYFRAME:
+                self.keyframes.append((ev[1], i))
+            elif ev[0] == EV_STEP:
+                self.frames += 1
+        self.keyframe_frames = [k[0] for k in self.keyframes]
+        self._rewind()
+
+    def _rewind(self):
+        self.sim.restore(self.initial)
+        self.pos = 1
+        self.frame = 0
+        self.speed = 0.0
+        self.silent = False
+
+    def advance(self):
+        """Runs the next recorded step; returns its collision mask, or None at the end."""
+        events = self.events
+        sim = self.sim
+        while self.pos < len(events):
+            ev = events[self.pos]
+            self.pos += 1
+            tag = ev[0]
+            if tag == EV_STEP:
+                self.frame += 1
+                return sim.step(ev[1], self.speed, self.silent)
+            elif tag == EV_SPEED:
+                self.speed = ev[1]
+            elif tag == EV_SILENT:
+                self.silent = ev[1]
+            elif tag == EV_RESIZE:
+                sim.resize(ev[1], ev[2])
+            elif tag == EV_BALL_SIZE:
+                sim.ball_size = ev[1]
+            elif tag == EV_COLLISIONS:
+                sim.ball_collisions = ev[1]
+        return None
+
+    def seek(self, frame):
+        """Puts the simulation at the state after `frame` steps, in O(keyframe interval) steps."""
+        frame = max(0, min(int(frame), self.frames))
+        k = bisect.bisect_right(self.keyframe_frames, frame) - 1
+        if k >= 0 and not (self.frame <= frame and self.frame >= self.keyframe_frames[k]):
+            kf_frame, idx = self.keyframes[k]
+            data = self.events[idx][2]
+            self.sim.restore(data['state'])
+            self.speed = data['speed'] if data['speed'] is not None else self.speed
+            self.silent = bool(data['silent'])
+            self.frame = kf_frame
+            self.pos = idx + 1
+        elif k < 0 and self.frame > frame:
+            self._rewind()
+        while self.frame < frame:
+            if self.advance() is None:
+                break
+        return self.frame
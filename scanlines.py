@@ -0,0 +1,78 @@
+"""
+Scanline overlay for zigzag.py
+  - One canvas image item instead of one line item per SCANLINE_STEP pixels
+  - Rendered PhotoImages kept in a small LRU cache keyed by (width, height, step),
+    so resizes back to a known size and show/hide toggles are O(1) canvas calls
+"""
+
+import tkinter as tk
+from collections import OrderedDict
+
+from screen import SCANLINE_COLOR
+SCANLINE_CACHE_SIZE = 4
+
+
+class ScanlineOverlay:
+    def __init__(self, canvas, step, color=SCANLINE_COLOR, cache_size=SCANLINE_CACHE_SIZE, tag='scan_line', master=None):
+        self.canvas = canvas
+        self.master = master if master is not None else canvas
+        self.step = max(1, int(step))
+        self.color = color
+        self.cache_size = max(1, cache_size)
+        self.tag = tag
+        self.cache = OrderedDict()
+        self.item_id = None
+        self.key = None
+        self.bbox = (0, 0, 1, 1)
+        self.visible = False
+
+    def _image(self, w, h, step):
+        key = (w, h, step)
+        img = self.cache.get(key)
+        if img is not None:
+            self.cache.move_to_end(key)
+            return img
+        # a blank PhotoImage is transparent; only the scanline rows are painted
+        img = tk.PhotoImage(master=self.master, width=w, height=h)
+        for yy in range(0, h, step):
+            img.put(self.color, to=(0, yy, w, yy + 1))
+        self.cache[key] = img
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return img
+
+    def place(self, bbox, visible=True):
+        self.bbox = bbox
+        try:
+            if self.item_id is None:
+                self.item_id = self.canvas.create_image(bbox[0], bbox[1], anchor='nw', state='hidden', tags=self.tag)
+            else:
+                self.canvas.coords(self.item_id, bbox[0], bbox[1])
+        except:
+            return
+        self.set_visible(visible)
+
+    def set_visible(self, visible):
+        if self.item_id is None:
+            return
+        try:
+            if visible:
+                self._sync_image()
+            if visible != self.visible:
+                self.canvas.itemconfig(self.item_id, state='normal' if visible else 'hidden')
+                self.visible = visible
+        except:
+            pass
+
+    def set_step(self, step):
+        self.step = max(1, int(step))
+        if self.visible:
+            try: self._sync_image()
+            except: pass
+
+    def _sync_image(self):
+        x0, y0, x1, y1 = self.bbox
+        key = (max(1, x1 - x0), max(1, y1 - y0), self.step)
+        if key != self.key:
+            self.canvas.itemconfig(self.item_id, image=self._image(*key))
+            self.key = key
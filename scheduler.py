@@ -0,0 +1,109 @@
+"""
+Frame pacing for zigzag.py
+  - FrameScheduler: fires a callback at absolute deadlines of 1/fps (Tk after() delays are
+    computed from the deadline, so lateness is compensated instead of accumulating);
+    stop()/start() cancel and re-arm the timer, nothing polls while stopped
+  - FixedTimestep: accumulator that turns elapsed wall time into a whole number of
+    fixed physics steps plus an interpolation factor for rendering; catch_up() returns
+    every step due at once (for catching up after rendering was suspended)
+"""
+
+import time
+
+TARGET_FPS_CHOICES = (30, 50, 60, 120)
+DEFAULT_FPS = 60
+PHYSICS_HZ = 60
+MAX_STEPS_PER_FRAME = 8
+
+
+class FrameScheduler:
+    def __init__(self, widget, callback, fps=DEFAULT_FPS):
+        self.widget = widget
+        self.callback = callback
+        self.after_id = None
+        self.running = False
+        self.deadline = 0.0
+        self.dropped = 0
+        self.lateness = 0.0
+        self.set_fps(fps)
+
+    def set_fps(self, fps):
+        self.fps = max(1, int(fps))
+        self.period = 1.0 / self.fps
+
+    def start(self):
+        if self.running:
+            return
+        self.running = True
+        self.deadline = time.perf_counter()
+        self._arm()
+
+    def stop(self):
+        self.running = False
+        if self.after_id is not None:
+            try: self.widget.after_cancel(self.after_id)
+            except Exception: pass
+            self.after_id = None
+
+    def _arm(self):
+        delay_ms = max(0, int((self.deadline - time.perf_counter()) * 1000.0))
+        self.after_id = self.widget.after(delay_ms, self._tick)
+
+    def _tick(self):
+        self.after_id = None
+        if not self.running:
+            return
+        now = time.perf_counter()
+        self.lateness = max(0.0, now - self.deadline)
+        try:
+            self.callback(now)
+        finally:
+            if self.running:
+                self.deadline += self.period
+                behind = time.perf_counter() - self.deadline
+                if behind > self.period:
+                    # too late for these deadlines: skip them rather than bursting to catch up
+                    missed = int(behind / self.period)
+                    self.deadline += missed * self.period
+                    self.dropped += missed
+                self._arm()
+
+
+class FixedTimestep:
+    def __init__(self, hz=PHYSICS_HZ, max_steps=MAX_STEPS_PER_FRAME):
+        self.step = 1.0 / hz
+        self.max_steps = max_steps
+        self.acc = 0.0
+        self.last = None
+
+    def reset(self, now=None):
+        self.last = now
+        self.acc = 0.0
+
+    def advance(self, now):
+        """Number of physics steps due at `now`; the remainder stays in the accumulator."""
+        if self.last is None:
+            self.last = now
+        self.acc += max(0.0, now - self.last)
+        self.last = now
+        steps = int(self.acc / self.step)
+        if steps > self.max_steps:
+            steps = self.max_steps
+            self.acc %= self.step
+        else:
+            self.acc -= steps * self.step
+        return steps
+
+    def catch_up(self, now):
+        """Like advance() without the per-frame cap: every step due since the last call."""
+        if self.last is None:
+            self.last = now
+        self.acc += max(0.0, now - self.last)
+        self.last = now
+        steps = int(self.acc / self.step)
+        self.acc -= steps * self.step
+        return steps
+
+    @property
+    def alpha(self):
+        return min(1.0, self.acc / self.step)
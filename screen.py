@@ -0,0 +1,67 @@
+"""
+Screen geometry and palette shared by zigzag.py and the headless tools (export.py, stream.py)
+  - PALET / THEMES, default sizes and speeds, scanline step and colour
+  - frame_rects: the 4:3 content box and the frame rectangles for a canvas size
+  - No Tk imports, so the headless tools run on a Python without Tk
+"""
+
+from colors import dim_color
+
+PALET = [
+    "#000000", # 0: pure black
+    "#E40027", # 1: red
+    "#F8D034", # 2: yellow
+    "#264BCC", # 3: blue
+    "#2AA146", # 4: green
+    "#B3B4B6", # 5: light gray
+    "#2C2C2E", # 6: dark gray
+    "#FFFFFF", # 7: overlay text
+]
+# palette sets switched by the 'dark' schedule; same indices as PALET
+THEMES = {
+    'light': PALET,
+    'dark': [PALET[0]] + [dim_color(c, 0.55) for c in PALET[1:]],
+}
+
+DEFAULT_CANVAS_W = 800
+DEFAULT_CANVAS_H = 600
+DEFAULT_BALL_SIZE = 36
+DEFAULT_BASE_SPEED = 5.0
+BORDER_LAYER = 32
+INNER_THIN = BORDER_LAYER // 4
+SCANLINE_STEP = 3
+TRAIL_MAX = 30
+SCANLINE_COLOR = '#0b0b0b'
+
+
+def frame_rects(w, h):
+    """4:3 content box centred in a w x h canvas, and the 7 frame rectangles (PALET order)."""
+    target_w = min(w, int(h * 4.0 / 3.0))
+    target_h = int(target_w * 3.0 / 4.0)
+    if target_w < 4:
+        target_w = 4
+        target_h = 3
+    x0 = (w - target_w)//2
+    y0 = (h - target_h)//2
+    x1 = x0 + target_w
+    y1 = y0 + target_h
+
+    rects = [(0, 0, w, h)]
+    for mul in (4, 3, 2, 1):
+        bx0 = x0 - BORDER_LAYER * mul
+        by0 = y0 - BORDER_LAYER * mul
+        bx1 = x1 + BORDER_LAYER * mul
+        by1 = y1 + BORDER_LAYER * mul
+        bx0 = max(0, bx0); by0 = max(0, by0)
+        bx1 = min(w, bx1); by1 = min(h, by1)
+        rects.append((bx0, by0, bx1, by1))
+
+    inner_bx0 = x0 - INNER_THIN
+    inner_by0 = y0 - INNER_THIN
+    inner_bx1 = x1 + INNER_THIN
+    inner_by1 = y1 + INNER_THIN
+    inner_bx0 = max(0, inner_bx0); inner_by0 = max(0, inner_by0)
+    inner_bx1 = min(w, inner_bx1); inner_by1 = min(h, inner_by1)
+    rects.append((inner_bx0, inner_by0, inner_bx1, inner_by1))
+    rects.append((x0, y0, x1, y1))
+    return (x0, y0, x1, y1), rects
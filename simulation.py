@@ -0,0 +1,328 @@
+"""
+Headless ball simulation for zigzag.py
+  - Ball state kept as struct-of-arrays NumPy buffers, one slot per ball
+  - step() moves every ball at once with the same wall bounce, jitter,
+    speed boost and silent-mode slowdown rules as the Tk idle screen; wall contacts are
+    solved analytically (exact hit time, any number of bounces per step)
+  - fast_forward() jumps over stretches without wall contact: O(bounces), not O(steps)
+  - Optional ball-to-ball bouncing with a uniform-grid broad phase
+  - No Tk imports: usable for tests, benchmarks and off-screen rendering
+"""
+
+import random
+import numpy as np
+
+from colors import quantized_color_random
+
+DEFAULT_WIDTH = 800
+DEFAULT_HEIGHT = 600
+SPEED_BOOST_FRAMES = 12
+SPEED_BOOST_MULT = 1.45
+SILENT_SPEED_DIV = 2.0
+JITTER = 0.35
+# bounces of one ball inside one step that get per-contact effects (a corner pocket can
+# ping-pong); any distance left after that is folded analytically (counted in bounce_overflows)
+MAX_BOUNCES = 64
+# half of the 3x3 neighbourhood: every adjacent cell pair is visited once
+NEIGHBOUR_OFFSETS = ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1))
+
+
+def grid_pairs(x, y, cell):
+    """Candidate pairs (i, j) of points sharing or neighbouring a cell of a uniform grid."""
+    n = x.size
+    if n < 2:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+    cx = np.floor(x / cell).astype(np.int64)
+    cy = np.floor(y / cell).astype(np.int64)
+    cx -= cx.min() - 1
+    cy -= cy.min() - 1
+    stride = int(cy.max()) + 2
+    key = cx * stride + cy
+    order = np.argsort(key, kind='stable')
+    sorted_key = key[order]
+    ball = np.arange(n)
+
+    out_i, out_j = [], []
+    for ox, oy in NEIGHBOUR_OFFSETS:
+        nkey = (cx + ox) * stride + (cy + oy)
+        lo = np.searchsorted(sorted_key, nkey, 'left')
+        cnt = np.searchsorted(sorted_key, nkey, 'right') - lo
+        total = int(cnt.sum())
+        if total == 0:
+            continue
+        i = np.repeat(ball, cnt)
+        offs = np.arange(total) - np.repeat(np.cumsum(cnt) - cnt, cnt)
+        j = order[np.repeat(lo, cnt) + offs]
+        if ox == 0 and oy == 0:
+            keep = i < j
+            i = i[keep]; j = j[keep]
+        out_i.append(i); out_j.append(j)
+    if not out_i:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+    return np.concatenate(out_i), np.concatenate(out_j)
+
+
+class Simulation:
+    """N bouncing balls inside a width x height box (content-local coordinates)."""
+
+    def __init__(self, count=1, width=DEFAULT_WIDTH, height=DEFAULT_HEIGHT, ball_size=36, seed=None,
+                 ball_collisions=False):
+        self.count = max(1, int(count))
+        self.width = max(1, width)
+        self.height = max(1, height)
+        self.ball_size = ball_size
+        self.ball_collisions = ball_collisions
+        self.rng = np.random.default_rng(seed)
+        self.color_rng = random.Random(seed)
+
+        n = self.count
+        self.x = np.empty(n); self.y = np.empty(n)
+        self.prev_x = np.empty(n); self.prev_y = np.empty(n)
+        self.dir_x = np.empty(n); self.dir_y = np.empty(n)
+        self.speed = np.zeros(n)
+        self.boost = np.zeros(n, dtype=np.int32)
+        self.color = np.empty(n, dtype=np.uint32)
+        self.bounce_overflows = 0
+
+        self.x[0] = DEFAULT_WIDTH * 0.25
+        self.y[0] = DEFAULT_HEIGHT * 0.4
+        if n > 1:
+            self.x[1:] = self.rng.uniform(0, max(0, self.width - ball_size), n - 1)
+            self.y[1:] = self.rng.uniform(0, max(0, self.height - ball_size), n - 1)
+        self.prev_x[:] = self.x; self.prev_y[:] = self.y
+
+        angle = self.rng.uniform(-0.9, 0.9, n)
+        dx = np.cos(angle); dy = np.sin(angle)
+        if n > 1:
+            dx[1:] *= self.rng.choice((-1.0, 1.0), n - 1)
+        dx = np.where(np.abs(dx) < 0.2, np.where(dx >= 0, 0.2, -0.2), dx)
+        dy = np.where(np.abs(dy) < 0.2, np.where(dy >= 0, 0.2, -0.2), dy)
+        mag = np.hypot(dx, dy)
+        mag[mag == 0] = 1.0
+        self.dir_x[:] = dx / mag
+        self.dir_y[:] = dy / mag
+        self.recolor(np.arange(n))
+
+    def snapshot(self):
+        """Full state as JSON-friendly values; restore() brings a same-sized simulation back to it."""
+        version, internal, gauss = self.color_rng.getstate()
+        return {
+            'width': self.width, 'height': self.height, 'ball_size': self.ball_size,
+            'ball_collisions': self.ball_collisions,
+            'x': self.x.tolist(), 'y': self.y.tolist(),
+            'dir_x': self.dir_x.tolist(), 'dir_y': self.dir_y.tolist(),
+            'boost': self.boost.tolist(), 'color': self.color.tolist(),
+            'rng': self.rng.bit_generator.state,
+            'color_rng': [version, list(internal), gauss],
+        }
+
+    def restore(self, state):
+        self.width = state['width']; self.height = state['height']
+        self.ball_size = state['ball_size']
+        self.ball_collisions = state.get('ball_collisions', self.ball_collisions)
+        self.x[:] = state['x']; self.y[:] = state['y']
+        self.prev_x[:] = self.x; self.prev_y[:] = self.y
+        self.dir_x[:] = state['dir_x']; self.dir_y[:] = state['dir_y']
+        self.boost[:] = state['boost']; self.color[:] = state['color']
+        self.rng.bit_generator.state = state['rng']
+        version, internal, gauss = state['color_rng']
+        self.color_rng.setstate((version, tuple(internal), gauss))
+
+    def interpolate(self, alpha):
+        """Render positions between the previous and current step (alpha in [0, 1])."""
+        return (self.prev_x + (self.x - self.prev_x) * alpha,
+                self.prev_y + (self.y - self.prev_y) * alpha)
+
+    def color_hex(self, i=0):
+        return f"#{int(self.color[i]):06x}"
+
+    def recolor(self, idx):
+        for i in np.atleast_1d(idx).tolist():
+            self.color[i] = int(quantized_color_random(solid_bright=True, rng=self.color_rng)[1:], 16)
+
+    def resize(self, width, height):
+        self.width = max(1, width)
+        self.height = max(1, height)
+        np.minimum(self.x, max(0, self.width - self.ball_size), out=self.x)
+        np.minimum(self.y, max(0, self.height - self.ball_size), out=self.y)
+
+    def hit(self, idx):
+        """Collision effects: speed boost, new colour and a jittered direction."""
+        idx = np.atleast_1d(idx)
+        if idx.size == 0:
+            return
+        self.boost[idx] = SPEED_BOOST_FRAMES
+        self.recolor(idx)
+        jitter = self.rng.uniform(-JITTER, JITTER, idx.size)
+        nxv = self.dir_x[idx] + jitter * 0.25
+        nyv = self.dir_y[idx] - jitter * 0.25
+        mag = np.hypot(nxv, nyv)
+        mag[mag == 0] = 1.0
+        self.dir_x[idx] = nxv / mag
+        self.dir_y[idx] = nyv / mag
+
+    def collide_balls(self):
+        """Elastic bounces between touching balls; returns the mask of balls that were hit."""
+        hit = np.zeros(self.count, dtype=bool)
+        size = self.ball_size
+        i, j = grid_pairs(self.x, self.y, size)
+        if i.size == 0:
+            return hit
+        dx = self.x[j] - self.x[i]
+        dy = self.y[j] - self.y[i]
+        d2 = dx * dx + dy * dy
+        touching = d2 < size * size
+        if not touching.any():
+            return hit
+        i = i[touching]; j = j[touching]; dx = dx[touching]; dy = dy[touching]
+        d = np.sqrt(d2[touching])
+        same = d == 0
+        d[same] = 1.0; dx[same] = 1.0; dy[same] = 0.0
+        nx = dx / d; ny = dy / d
+
+        # equal masses: exchange the direction components along the contact normal
+        rel = (self.dir_x[j] - self.dir_x[i]) * nx + (self.dir_y[j] - self.dir_y[i]) * ny
+        rel = np.minimum(rel, 0.0)
+        np.add.at(self.dir_x, i, rel * nx); np.add.at(self.dir_y, i, rel * ny)
+        np.add.at(self.dir_x, j, -rel * nx); np.add.at(self.dir_y, j, -rel * ny)
+
+        push = (size - d) * 0.5
+        np.add.at(self.x, i, -nx * push); np.add.at(self.y, i, -ny * push)
+        np.add.at(self.x, j, nx * push); np.add.at(self.y, j, ny * push)
+        np.clip(self.x, 0, max(0, self.width - size), out=self.x)
+        np.clip(self.y, 0, max(0, self.height - size), out=self.y)
+
+        bounced = rel < 0
+        hit[i[bounced]] = True
+        hit[j[bounced]] = True
+        return hit
+
+    def _wall_times(self, idx):
+        """Distance along the direction until balls idx touch an x wall and a y wall (inf: never)."""
+        max_x = max(0.0, self.width - self.ball_size)
+        max_y = max(0.0, self.height - self.ball_size)
+        x = self.x[idx]; y = self.y[idx]
+        ux = self.dir_x[idx]; uy = self.dir_y[idx]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            tx = np.where(ux > 0, (max_x - x) / ux, np.where(ux < 0, -x / ux, np.inf))
+            ty = np.where(uy > 0, (max_y - y) / uy, np.where(uy < 0, -y / uy, np.inf))
+        # a box no larger than the ball pins that axis instead of bouncing forever
+        if max_x <= 0:
+            tx[:] = np.inf
+        if max_y <= 0:
+            ty[:] = np.inf
+        return np.maximum(tx, 0.0), np.maximum(ty, 0.0)
+
+    def _move_walls(self, dist):
+        """Moves ball i dist[i] px along its direction, bouncing off the walls at the exact
+        contact point as often as needed; returns the mask of balls that hit a wall."""
+        max_x = max(0.0, self.width - self.ball_size)
+        max_y = max(0.0, self.height - self.ball_size)
+        x, y, dir_x, dir_y = self.x, self.y, self.dir_x, self.dir_y
+        np.clip(x, 0, max_x, out=x)
+        np.clip(y, 0, max_y, out=y)
+        hit = np.zeros(self.count, dtype=bool)
+        rem = np.broadcast_to(np.asarray(dist, dtype=float), (self.count,)).copy()
+        idx = np.flatnonzero(rem > 0)
+        for _ in range(MAX_BOUNCES):
+            if idx.size == 0:
+                break
+            tx, ty = self._wall_times(idx)
+            t = np.minimum(tx, ty)
+            r = rem[idx]
+            free = t > r
+            if free.any():
+                fi = idx[free]
+                x[fi] += dir_x[fi] * r[free]
+                y[fi] += dir_y[fi] * r[free]
+            bounce = ~free
+            if not bounce.any():
+                break
+            bi = idx[bounce]; tb = t[bounce]
+            x[bi] += dir_x[bi] * tb
+            y[bi] += dir_y[bi] * tb
+            rem[bi] = r[bounce] - tb
+            on_x = bi[tx[bounce] <= tb]
+            on_y = bi[ty[bounce] <= tb]
+            # snap onto the wall that was touched (a corner touches both)
+            x[on_x] = np.where(dir_x[on_x] > 0, max_x, 0.0)
+            y[on_y] = np.where(dir_y[on_y] > 0, max_y, 0.0)
+            hit[bi] = True
+            self.hit(bi)
+            # reflect after the jitter so the normal component always points away from the wall
+            dir_x[on_x] = np.where(x[on_x] > 0, -np.abs(dir_x[on_x]), np.abs(dir_x[on_x]))
+            dir_y[on_y] = np.where(y[on_y] > 0, -np.abs(dir_y[on_y]), np.abs(dir_y[on_y]))
+            idx = bi[rem[bi] > 0]
+        else:
+            if idx.size:
+                # still moving after MAX_BOUNCES contacts (tiny box or a huge step): fold the rest
+                self.bounce_overflows += idx.size
+                self._fold_walls(idx, rem[idx], max_x, max_y)
+                hit[idx] = True
+        return hit
+
+    def _fold_walls(self, idx, dist, max_x, max_y):
+        """Mirror reflection of the remaining distance, per axis modulo the round trip 2*(extent-size):
+        exact wall motion without per-contact effects, in constant time however far the balls go."""
+        for pos, d, m in ((self.x, self.dir_x, max_x), (self.y, self.dir_y, max_y)):
+            if m <= 0:
+                pos[idx] = 0.0
+                continue
+            u = d[idx]
+            w = np.mod(pos[idx] + u * dist, 2.0 * m)
+            back = w > m
+            pos[idx] = np.where(back, 2.0 * m - w, w)
+            d[idx] = np.where(back, -u, u)
+
+    def step(self, dt, base_speed, silent=False):
+        """Advances every ball by dt seconds; returns the boolean mask of balls that hit a wall or a ball."""
+        speed = self.speed
+        speed.fill(base_speed)
+        boosted = self.boost > 0
+        speed[boosted] *= SPEED_BOOST_MULT
+        self.boost[boosted] -= 1
+        if silent:
+            speed /= SILENT_SPEED_DIV
+
+        self.prev_x[:] = self.x; self.prev_y[:] = self.y
+        collided = self._move_walls(speed * (dt * 60.0))
+        if self.ball_collisions and self.count > 1:
+            touched = self.collide_balls()
+            self.hit(np.flatnonzero(touched))
+            collided |= touched
+        return collided
+
+    def fast_forward(self, steps, dt, base_speed, silent=False):
+        """Same motion as `steps` calls of step(), but runs of steps in which no ball touches a
+        wall and no boost runs out are done as one straight move, so the cost grows with the
+        number of bounces rather than the simulated time. Returns the mask of balls that bounced.
+        With ball-to-ball collisions every step is needed, so this simply steps."""
+        steps = int(steps)
+        hit = np.zeros(self.count, dtype=bool)
+        move = base_speed * (dt * 60.0) / (SILENT_SPEED_DIV if silent else 1.0)
+        jump_ok = move > 0 and not (self.ball_collisions and self.count > 1)
+        while steps > 0:
+            if jump_ok:
+                boosted = self.boost > 0
+                moves = np.where(boosted, move * SPEED_BOOST_MULT, move)
+                tx, ty = self._wall_times(slice(None))
+                # whole steps that end strictly before the first contact of any ball ...
+                n = min(steps, float((np.ceil(np.minimum(tx, ty) / moves) - 1).min()))
+                # ... and before any boost runs out
+                if boosted.any():
+                    n = min(n, int(self.boost[boosted].min()))
+                n = int(n)
+                if n > 0:
+                    self.x += self.dir_x * (moves * n)
+                    self.y += self.dir_y * (moves * n)
+                    self.prev_x[:] = self.x - self.dir_x * moves
+                    self.prev_y[:] = self.y - self.dir_y * moves
+                    self.boost[boosted] -= n
+                    self.speed[:] = moves / (dt * 60.0)
+                    steps -= n
+                    continue
+            hit |= self.step(dt, base_speed, silent)
+            steps -= 1
+        return hit
@@ -0,0 +1,190 @@
+"""
+Headless MJPEG/HTTP stream of the idle screen, for thin clients that can only run a browser
+  - One producer renders every frame once (the export.py pipeline: same Simulation, trail,
+    borders and scanlines as ZigZagApp) and encodes it once to JPEG (needs Pillow)
+  - Every client gets the same encoded bytes through its own bounded queue; a client that
+    falls behind loses its oldest frames instead of slowing down the producer or the others
+  - One asyncio event loop serves all clients; rendering and encoding run in a single worker
+    thread so the loop keeps writing while a frame is built; nothing is rendered without clients
+  - Text overlays (collision phrases, silent mode, HUD) are not drawn
+
+    python stream.py --seed 7                         # http://localhost:8080/
+    python stream.py --host 0.0.0.0 --port 8000 --fps 30 --size 1024x768 --quality 70
+"""
+
+import argparse, asyncio, io, sys
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+from export import simulate, rasterize
+from screen import THEMES, DEFAULT_BASE_SPEED
+
+DEFAULT_PORT = 8080
+JPEG_QUALITY = 80
+CLIENT_QUEUE = 2
+REQUEST_TIMEOUT = 10
+BOUNDARY = b'zigzagframe'
+INDEX_HTML = (b'<!doctype html><html><head><title>ZigZag Retro</title></head>'
+              b'<body style="margin:0;background:#000">'
+              b'<img src="/stream" style="width:100vw;height:100vh;object-fit:contain"></body></html>')
+
+
+def encode_jpeg(rgb, quality=JPEG_QUALITY):
+    out = io.BytesIO()
+    Image.fromarray(rgb).save(out, 'JPEG', quality=quality)
+    return out.getvalue()
+
+
+def render_frame(job, quality):
+    """(jpeg, part) for one frame; part is the multipart chunk written to every stream as is."""
+    jpeg = encode_jpeg(rasterize(job), quality)
+    part = (b'--' + BOUNDARY + b'\r\nContent-Type: image/jpeg\r\nContent-Length: %d\r\n\r\n' % len(jpeg)
+            + jpeg + b'\r\n')
+    return jpeg, part
+
+
+def response(status, content_type, body):
+    return (b'HTTP/1.1 %s\r\nContent-Type: %s\r\nContent-Length: %d\r\nCache-Control: no-cache\r\n'
+            b'Connection: close\r\n\r\n' % (status, content_type, len(body))) + body
+
+
+class Broadcaster:
+    def __init__(self, jobs, fps, quality=JPEG_QUALITY, queue_size=CLIENT_QUEUE):
+        self.jobs = jobs
+        self.period = 1.0 / fps
+        self.quality = quality
+        self.queue_size = queue_size
+        self.clients = set()
+        self.frames = 0
+        self.dropped = 0
+        self._wake = asyncio.Event()
+        self._executor = ThreadPoolExecutor(1)
+
+    def subscribe(self):
+        queue = asyncio.Queue(self.queue_size)
+        self.clients.add(queue)
+        self._wake.set()
+        return queue
+
+    def unsubscribe(self, queue):
+        self.clients.discard(queue)
+
+    def publish(self, frame):
+        self.frames += 1
+        for queue in self.clients:
+            if queue.full():
+                # slow consumer: drop its oldest frame, never wait for it
+                queue.get_nowait()
+                self.dropped += 1
+            queue.put_nowait(frame)
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        next_t = loop.time()
+        while True:
+            if not self.clients:
+                # nobody watching: render nothing until the next client arrives
+                self._wake.clear()
+                await self._wake.wait()
+                next_t = loop.time()
+            job = next(self.jobs)
+            self.publish(await loop.run_in_executor(self._executor, render_frame, job, self.quality))
+            next_t += self.period
+            delay = next_t - loop.time()
+            if delay < -self.period:
+                # too late for these deadlines: skip them rather than bursting to catch up
+                next_t = loop.time()
+            await asyncio.sleep(max(0.0, delay))
+
+    async def handle(self, reader, writer):
+        try:
+            request = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), REQUEST_TIMEOUT)
+            fields = request.split(b'\r\n', 1)[0].split()
+            path = fields[1].split(b'?', 1)[0] if len(fields) > 1 else b''
+            if path == b'/stream':
+                await self._stream(writer)
+            elif path == b'/frame.jpg':
+                queue = self.subscribe()
+                try:
+                    jpeg, _ = await queue.get()
+                finally:
+                    self.unsubscribe(queue)
+                writer.write(response(b'200 OK', b'image/jpeg', jpeg))
+            elif path == b'/':
+                writer.write(response(b'200 OK', b'text/html; charset=utf-8', INDEX_HTML))
+            else:
+                writer.write(response(b'404 Not Found', b'text/plain', b'not found\n'))
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError):
+            pass
+        except asyncio.CancelledError:
+            # server shutdown; the connection task ends here instead of logging the cancellation
+            pass
+        finally:
+            writer.close()
+
+    async def _stream(self, writer):
+        peer = writer.get_extra_info('peername')
+        queue = self.subscribe()
+        print(f'{peer} connected ({len(self.clients)} watching)')
+        try:
+            writer.write(b'HTTP/1.1 200 OK\r\nContent-Type: multipart/x-mixed-replace; boundary=' + BOUNDARY +
+                         b'\r\nCache-Control: no-cache\r\nConnection: close\r\n\r\n')
+            while True:
+                _, part = await queue.get()
+                writer.write(part)
+                await writer.drain()
+        finally:
+            self.unsubscribe(queue)
+            print(f'{peer} disconnected ({len(self.clients)} watching, {self.dropped} frames dropped so far)')
+
+
+async def serve(host, port, width, height, seed, fps, quality=JPEG_QUALITY, queue_size=CLIENT_QUEUE, **options):
+    broadcaster = Broadcaster(simulate(None, width, height, seed, fps=fps, **options), fps, quality, queue_size)
+    server = await asyncio.start_server(broadcaster.handle, host, port)
+    producer = asyncio.create_task(broadcaster.run())
+    print(f'Streaming {width}x{height} at {fps} fps on http://{host}:{port}/ (MJPEG: /stream, still: /frame.jpg)')
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        producer.cancel()
+
+
+def parse_args(argv=None):
+    ap = argparse.ArgumentParser(description='Serve the idle screen as an MJPEG stream over HTTP')
+    ap.add_argument('--host', default='127.0.0.1', help='0.0.0.0 to serve other machines')
+    ap.add_argument('--port', type=int, default=DEFAULT_PORT)
+    ap.add_argument('--seed', type=int, default=None)
+    ap.add_argument('--fps', type=int, default=30)
+    ap.add_argument('--size', default='800x600', help='frame size WxH')
+    ap.add_argument('--quality', type=int, default=JPEG_QUALITY, help='JPEG quality 1-95')
+    ap.add_argument('--queue', type=int, default=CLIENT_QUEUE, help='frames buffered per client before dropping')
+    ap.add_argument('--speed', type=float, default=DEFAULT_BASE_SPEED)
+    ap.add_argument('--balls', type=int, default=1)
+    ap.add_argument('--ball-collisions', action='store_true')
+    ap.add_argument('--theme', choices=sorted(THEMES), default='light')
+    ap.add_argument('--no-trail', action='store_true')
+    ap.add_argument('--no-scanlines', action='store_true')
+    return ap.parse_args(argv)
+
+
+def main():
+    args = parse_args()
+    if Image is None:
+        sys.exit('Streaming needs Pillow for JPEG encoding (pip install pillow)')
+    w, h = (int(v) for v in args.size.lower().split('x'))
+    try:
+        asyncio.run(serve(args.host, args.port, w, h, args.seed, args.fps, args.quality, max(1, args.queue),
+                          speed=args.speed, ball_count=args.balls, ball_collisions=args.ball_collisions,
+                          theme=args.theme, show_trail=not args.no_trail, show_scanlines=not args.no_scanlines))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,20 @@
+import os, subprocess, sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# a fresh interpreter where tkinter cannot be imported, like a server Python without Tk
+SCRIPT = """
+import sys
+sys.modules['tkinter'] = None
+sys.path.insert(0, %r)
+import export, stream
+written = export.export(%r, 3, 160, 120, seed=1, workers=1)
+assert len(written) == 3, written
+assert 'zigzag' not in sys.modules
+"""
+
+
+def test_export_and_stream_import_without_tk(tmp_path):
+    out = str(tmp_path / 'frames')
+    subprocess.run([sys.executable, '-c', SCRIPT % (ROOT, out)], check=True, cwd=tmp_path)
+    assert sorted(os.listdir(out)) == ['frame_000000.png', 'frame_000001.png', 'frame_000002.png']
@@ -0,0 +1,32 @@
+import os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from simulation import Simulation
+
+
+def test_bounce_overflow_keeps_full_distance():
+    sim = Simulation(5, 100, 80, 20, seed=2)
+    sim.hit = lambda idx: None   # no jitter: the exact answer is a mirror fold per axis
+    np.clip(sim.x, 0, 80, out=sim.x)
+    np.clip(sim.y, 0, 60, out=sim.y)
+    x0, y0, ux, uy = sim.x.copy(), sim.y.copy(), sim.dir_x.copy(), sim.dir_y.copy()
+    dist = 12345.6
+    sim._move_walls(dist)
+
+    def fold(p, u, m):
+        w = np.mod(p + u * dist, 2 * m)
+        return np.where(w > m, 2 * m - w, w)
+
+    assert sim.bounce_overflows == 5
+    assert np.allclose(sim.x, fold(x0, ux, 80))
+    assert np.allclose(sim.y, fold(y0, uy, 60))
+
+
+def test_normal_steps_do_not_overflow():
+    sim = Simulation(20, 800, 600, 36, seed=1)
+    for _ in range(600):
+        sim.step(1 / 60, 24.0)
+    assert sim.bounce_overflows == 0
@@ -0,0 +1,26 @@
+import os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from trail import TrailBuffer
+
+
+def test_shrink_keeps_newest_points():
+    trail = TrailBuffer(30)
+    for i in range(30):
+        trail.push(i, i, '#ffffff')
+    head = trail.points[0]
+    trail.resize(10)
+    assert trail.maxlen == 10
+    assert trail.points[0] == head
+    assert [p[0] for p in trail] == list(range(29, 19, -1))
+
+
+def test_grow_keeps_order():
+    trail = TrailBuffer(5)
+    for i in range(5):
+        trail.push(i, i, '#ffffff')
+    trail.resize(20)
+    assert [p[0] for p in trail] == [4, 3, 2, 1, 0]
+    trail.push(5, 5, '#ffffff')
+    assert len(trail) == 6 and trail.points[0][0] == 5
@@ -0,0 +1,55 @@
+import os, sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+import stubtk
+stubtk.install()
+
+import zigzag
+
+
+class Event:
+    def __init__(self, widget):
+        self.widget = widget
+
+
+def make_app(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    root = stubtk.Tk()
+    app = zigzag.ZigZagApp(root, seed=5)
+    app.scheduler.stop()
+    app.day.stop()
+    root._after.clear()
+    return root, app
+
+
+def test_resume_recolors_every_ball(monkeypatch, tmp_path):
+    root, app = make_app(monkeypatch, tmp_path)
+    clock = [1000.0]
+    monkeypatch.setattr(zigzag.time, 'perf_counter', lambda: clock[0])
+    app.timestep.reset(clock[0])
+    app._on_unmap(Event(root))
+    assert app.suspended
+    before = app.sim.color_hex(0)
+    for _ in range(120):
+        clock[0] += 1.0
+        root.run_pending(limit=1)
+    assert app.sim.color_hex(0) != before
+    app._on_map(Event(root))
+    app.scheduler.stop()
+    assert not app.suspended
+    fills = [app.draw._opts[iid]['fill'] for iid in app.ball_item_ids]
+    assert fills == [app.sim.color_hex(i) for i in range(app.sim.count)]
+
+
+def test_hidden_tick_stops_while_paused(monkeypatch, tmp_path):
+    root, app = make_app(monkeypatch, tmp_path)
+    app._on_unmap(Event(root))
+    app.toggle_pause()
+    root.run_pending(limit=5)
+    assert app._hidden_after is None and not root._after
+    app.toggle_pause()
+    assert app._hidden_after is not None
+    app.quit_app()
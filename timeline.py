@@ -0,0 +1,107 @@
+"""
+Timed visual effects for zigzag.py, advanced once per frame (no Tk timers)
+  - Timeline: tweens with a duration, an update(t) callback (t eased, 0..1) and an
+    optional done() callback; starting a tween under an existing key restarts it
+  - TextPopupPool: preallocated hidden canvas text items handed out to popups; when all
+    are busy the oldest one is taken over, so bursts never create items or timers
+"""
+
+from collections import OrderedDict
+
+
+def linear(t):
+    return t
+
+def ease_out(t):
+    return 1.0 - (1.0 - t) * (1.0 - t)
+
+
+class Tween:
+    __slots__ = ('start', 'duration', 'update', 'done', 'ease')
+
+    def __init__(self, start, duration, update, done, ease):
+        self.start = start
+        self.duration = duration
+        self.update = update
+        self.done = done
+        self.ease = ease
+
+
+class Timeline:
+    def __init__(self, now=0.0):
+        self.tweens = OrderedDict()
+        self.now = now
+        self._seq = 0
+
+    def __len__(self):
+        return len(self.tweens)
+
+    def __contains__(self, key):
+        return key in self.tweens
+
+    def add(self, duration, update, done=None, ease=linear, key=None):
+        """Starts a tween at the current time; an active tween with the same key is finished first."""
+        if key is None:
+            self._seq += 1
+            key = ('anon', self._seq)
+        else:
+            self.finish(key)
+        self.tweens[key] = Tween(self.now, max(1e-6, duration), update, done, ease)
+        update(ease(0.0))
+        return key
+
+    def finish(self, key):
+        tween = self.tweens.pop(key, None)
+        if tween is not None and tween.done is not None:
+            tween.done()
+
+    def cancel(self, key):
+        self.tweens.pop(key, None)
+
+    def advance(self, now):
+        self.now = now
+        if not self.tweens:
+            return
+        finished = []
+        for key, tween in self.tweens.items():
+            t = max(0.0, (now - tween.start) / tween.duration)
+            if t >= 1.0:
+                finished.append(key)
+                t = 1.0
+            tween.update(tween.ease(t))
+        for key in finished:
+            self.finish(key)
+
+    def reset(self, now):
+        """Moves every tween's start so a pause does not count as elapsed time."""
+        shift = now - self.now
+        for tween in self.tweens.values():
+            tween.start += shift
+        self.now = now
+
+
+class TextPopupPool:
+    def __init__(self, canvas, size, tag='overlay', **text_opts):
+        self.canvas = canvas
+        self.free = [canvas.create_text(0, 0, text='', state='hidden', tags=tag, **text_opts) for _ in range(size)]
+        self.busy = OrderedDict()   # item id -> owner key, oldest first
+
+    def acquire(self, timeline):
+        """A text item for a new popup; steals (finishes) the oldest popup when none is free."""
+        if not self.free:
+            timeline.finish(next(iter(self.busy.values())))
+        iid = self.free.pop()
+        self.busy[iid] = None
+        return iid
+
+    def bind(self, iid, key):
+        self.busy[iid] = key
+
+    def release(self, iid):
+        if self.busy.pop(iid, False) is not False:
+            try: self.canvas.itemconfig(iid, state='hidden')
+            except: pass
+            self.free.append(iid)
+
+    def items(self):
+        return self.free + list(self.busy)
@@ -0,0 +1,118 @@
+"""
+Trail subsystem for zigzag.py
+  - TrailBuffer: fixed-size ring buffer of trail points (newest first)
+  - TrailPool: preallocated canvas ovals reused every frame through coords/itemconfig;
+    draw through render.RenderLayer so unchanged fills and states are not resent
+  - slot_layout: radius and dimming level per trail slot, shared with the offline exporter
+"""
+
+import itertools, math
+from collections import deque
+from functools import lru_cache
+
+from colors import bright_lut, dim_ramp, AGE_LEVELS
+
+
+@lru_cache(maxsize=64)
+def slot_layout(total, ball_size, detail=AGE_LEVELS, levels=AGE_LEVELS):
+    """(radius, ramp level) per slot; only changes with the trail length, ball size or detail."""
+    stride = levels / detail
+    return tuple((ball_size * (0.85 - (idx / total) * 0.6) / 2, int(int(idx / total * detail) * stride))
+                 for idx in range(total))
+
+
+class TrailBuffer:
+    """Ring buffer of (x, y, color) points in content-local coordinates, newest first."""
+
+    def __init__(self, maxlen):
+        self.points = deque(maxlen=max(1, int(maxlen)))
+
+    def __len__(self):
+        return len(self.points)
+
+    def __iter__(self):
+        return iter(self.points)
+
+    @property
+    def maxlen(self):
+        return self.points.maxlen
+
+    def push(self, x, y, color):
+        self.points.appendleft((x, y, color))
+
+    def push_segment(self, x0, y0, x1, y1, color, interp_cap):
+        """Points from (x0, y0) up to the head (x1, y1): one every 2 px, at most interp_cap between."""
+        dx = x1 - x0; dy = y1 - y0
+        dist = math.hypot(dx, dy)
+        if dist <= 0:
+            return
+        interp_count = min(interp_cap, max(1, int(dist // 2)))
+        head_col = bright_lut(color, 1.5)
+        mid_col = bright_lut(color, 1.35)
+        for i in range(1, interp_count + 1):
+            t = i / (interp_count + 1)
+            self.points.appendleft((x0 + dx * t, y0 + dy * t, mid_col if i < interp_count else head_col))
+        self.points.appendleft((x1, y1, head_col))
+
+    def clear(self):
+        self.points.clear()
+
+    def resize(self, maxlen):
+        maxlen = max(1, int(maxlen))
+        if maxlen != self.points.maxlen:
+            # newest first: keep the points next to the ball, drop the old tail
+            self.points = deque(itertools.islice(self.points, maxlen), maxlen=maxlen)
+
+
+class TrailPool:
+    """Fixed pool of hidden ovals; slot i always shows the trail point of age i."""
+
+    def __init__(self, canvas, size, ramp=dim_ramp, levels=AGE_LEVELS, tag='trail'):
+        self.canvas = canvas
+        self.ramp = ramp
+        self.levels = levels
+        self.detail = levels
+        self.tag = tag
+        self.ids = []
+        self.visible = 0
+        self.ensure(size)
+
+    def ensure(self, size):
+        while len(self.ids) < size:
+            iid = self.canvas.create_oval(0, 0, 0, 0, fill='', outline='', state='hidden', tags=self.tag)
+            self.ids.append(iid)
+
+    def set_detail(self, detail):
+        """Number of distinct dimming steps used (<= levels); fewer steps means fewer fill changes."""
+        self.detail = max(1, min(int(detail), self.levels))
+
+    def draw(self, points, ox, oy, ball_size):
+        canvas = self.canvas
+        ramp = self.ramp
+        layout = slot_layout(len(points) or 1, ball_size, self.detail, self.levels)
+        half = ball_size / 2
+        n = 0
+        for idx, (tx, ty, tcol) in enumerate(points):
+            if idx >= len(self.ids):
+                break
+            r, level = layout[idx]
+            color = ramp(tcol)[level]
+            cx = ox + tx + half
+            cy = oy + ty + half
+            iid = self.ids[idx]
+            try:
+                canvas.coords(iid, cx - r, cy - r, cx + r, cy + r)
+                canvas.itemconfig(iid, fill=color, state='normal')
+            except:
+                pass
+            n += 1
+        self._hide_from(n)
+
+    def hide_all(self):
+        self._hide_from(0)
+
+    def _hide_from(self, start):
+        for idx in range(start, self.visible):
+            try: self.canvas.itemconfig(self.ids[idx], state='hidden')
+            except: pass
+        self.visible = start
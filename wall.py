@@ -0,0 +1,238 @@
+"""
+Video-wall mode for zigzag.py: one ball world spread over several screens
+  - One simulation process owns the Simulation and publishes it every physics step into
+    multiprocessing.shared_memory (SharedBalls), guarded by a seqlock
+  - One renderer process per screen runs a ZigZagApp whose whole canvas is a slice
+    (viewport) of the larger virtual content box, mapped 1:1 with no border and no control
+    bar; WallView reads the shared state lock-free and looks like a Simulation to the app
+  - Renderers use the framebuffer renderer so a ball crossing a screen edge is clipped
+    at the content edge; every extra screen is an extra process, not a slower Tk loop
+
+    python wall.py --grid 3x1 --tile 800x600 --seed 7    # three 800x600 screens side by side
+"""
+
+import argparse, sys, time
+import multiprocessing as mp
+from datetime import datetime
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from simulation import Simulation
+from scheduler import FixedTimestep, DEFAULT_FPS, TARGET_FPS_CHOICES
+from daytime import DailyWindow, DEFAULT_SCHEDULES, MAX_SLEEP
+
+# per-ball float64 rows and uint32 rows of the shared block, in this order
+FLOAT_FIELDS = ('x', 'y', 'prev_x', 'prev_y', 'dir_x', 'dir_y', 'speed', 'boost')
+INT_FIELDS = ('color', 'hits')
+# seq (uint64) followed by META float64 values
+META = ('frame', 'stamp', 'step', 'silent', 'ball_size')
+HEADER_SIZE = 64
+
+
+class SharedBalls:
+    """Ball state in one shared-memory block. Single writer (publish), any number of readers (read)."""
+
+    def __init__(self, count, name=None):
+        self.count = count
+        size = HEADER_SIZE + count * (8 * len(FLOAT_FIELDS) + 4 * len(INT_FIELDS))
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+        else:
+            # child processes share the creator's resource tracker; only the creator unlinks
+            self.shm = shared_memory.SharedMemory(name=name)
+        buf = self.shm.buf
+        self.seq = np.ndarray((1,), dtype=np.uint64, buffer=buf, offset=0)
+        self.meta = np.ndarray((len(META),), dtype=np.float64, buffer=buf, offset=8)
+        self.floats = np.ndarray((len(FLOAT_FIELDS), count), dtype=np.float64, buffer=buf, offset=HEADER_SIZE)
+        self.ints = np.ndarray((len(INT_FIELDS), count), dtype=np.uint32, buffer=buf,
+                               offset=HEADER_SIZE + self.floats.nbytes)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def publish(self, sim, hits, frame, stamp, step, silent):
+        seq = self.seq
+        seq[0] += 1     # odd: write in progress
+        self.meta[:] = (frame, stamp, step, float(silent), sim.ball_size)
+        for row, field in zip(self.floats, FLOAT_FIELDS):
+            row[:] = getattr(sim, field)
+        self.ints[0] = sim.color
+        self.ints[1] = hits
+        seq[0] += 1     # even again: snapshot complete
+
+    def read(self, floats, ints):
+        """Copies a consistent snapshot into floats/ints and returns the META values."""
+        seq = self.seq
+        while True:
+            before = int(seq[0])
+            if before & 1:
+                time.sleep(0)
+                continue
+            np.copyto(floats, self.floats)
+            np.copyto(ints, self.ints)
+            meta = self.meta.tolist()
+            # the writer did not touch the block while we copied: the snapshot is consistent
+            if int(seq[0]) == before:
+                return meta
+
+    def close(self):
+        self.seq = self.meta = self.floats = self.ints = None
+        self.shm.close()
+
+    def unlink(self):
+        self.shm.unlink()
+
+
+class WallView:
+    """Read side for one screen: the viewport (x0, y0, w, h) of the virtual box, scaled to the
+    screen's content size (resize()), in content-local coordinates like Simulation."""
+
+    def __init__(self, name, count, viewport):
+        self.shared = SharedBalls(count, name)
+        self.count = count
+        self.viewport = tuple(viewport)
+        self.width, self.height = self.viewport[2:]
+        self.scale = 1.0
+        self.ball_collisions = False
+        self._floats = np.zeros((len(FLOAT_FIELDS), count))
+        self._ints = np.zeros((len(INT_FIELDS), count), dtype=np.uint32)
+        for row, field in zip(self._floats, FLOAT_FIELDS):
+            setattr(self, field, row)
+        self.color, self.hits = self._ints
+        self.frame = 0
+        self.stamp = 0.0
+        self.step = 1.0 / 60
+        self.silent = False
+        self.ball_size = 36
+        self.pull()
+
+    def pull(self):
+        """Latest published state; returns the mask of balls that bounced since the last pull."""
+        last_hits = self.hits.copy()
+        frame, self.stamp, self.step, silent, ball_size = self.shared.read(self._floats, self._ints)
+        self.frame = int(frame)
+        self.silent = bool(silent)
+        ox, oy, _, _ = self.viewport
+        s = self.scale
+        self.ball_size = ball_size * s
+        for row, origin in ((self.x, ox), (self.prev_x, ox), (self.y, oy), (self.prev_y, oy)):
+            row -= origin
+            row *= s
+        return self.hits != last_hits
+
+    def resize(self, width, height):
+        """Called by the app's layout: the viewport is shown in a width x height content area."""
+        self.width = max(1, width)
+        self.height = max(1, height)
+        self.scale = min(self.width / self.viewport[2], self.height / self.viewport[3])
+
+    def alpha(self, now):
+        """Interpolation factor between prev and current positions at time.monotonic() `now`."""
+        return min(1.0, max(0.0, (now - self.stamp) / self.step)) if self.step else 1.0
+
+    def interpolate(self, alpha):
+        return (self.prev_x + (self.x - self.prev_x) * alpha,
+                self.prev_y + (self.y - self.prev_y) * alpha)
+
+    def color_hex(self, i=0):
+        return f"#{int(self.color[i]):06x}"
+
+    def close(self):
+        self.shared.close()
+
+
+def run_simulation(name, count, width, height, ball_size, seed, speed, stop, ball_collisions=False):
+    shared = SharedBalls(count, name)
+    sim = Simulation(count, width, height, ball_size, seed=seed, ball_collisions=ball_collisions)
+    hits = np.zeros(count, dtype=np.uint32)
+    window = DailyWindow(*DEFAULT_SCHEDULES['silent'])
+    timestep = FixedTimestep()
+    now = time.monotonic()
+    timestep.reset(now)
+    frame = 0
+    silent = False
+    next_check = now
+    shared.publish(sim, hits, frame, now, timestep.step, silent)
+    try:
+        while not stop.is_set():
+            now = time.monotonic()
+            if now >= next_check:
+                # like DayScheduler: evaluate at the next transition, not every step
+                wall_now = datetime.now()
+                silent = window.active(wall_now)
+                change = window.next_change(wall_now)
+                wait = MAX_SLEEP if change is None else min(MAX_SLEEP, (change - wall_now).total_seconds())
+                next_check = now + wait
+            steps = timestep.advance(now)
+            for _ in range(steps):
+                hits += sim.step(timestep.step, speed, silent)
+                frame += 1
+            if steps:
+                shared.publish(sim, hits, frame, now - timestep.acc, timestep.step, silent)
+            time.sleep(max(0.0, timestep.step - timestep.acc))
+    finally:
+        shared.close()
+
+
+def run_viewport(name, count, viewport, position, fps, crt):
+    import tkinter as tk
+    import zigzag
+    root = tk.Tk()
+    x0, y0, w, h = viewport
+    root.geometry(f"{w}x{h}+{position[0]}+{position[1]}")
+    wall = WallView(name, count, viewport)
+    app = zigzag.ZigZagApp(root, fps=fps, renderer='framebuffer', crt=crt, wall=wall)
+    root.title(f"ZigZag wall {x0},{y0} {w}x{h}")
+    try:
+        root.mainloop()
+    finally:
+        wall.close()
+
+
+def parse_args(argv=None):
+    ap = argparse.ArgumentParser(description='One ball world across several screens')
+    ap.add_argument('--grid', default='2x1', help='screens as COLSxROWS')
+    ap.add_argument('--tile', default='800x600', help='content size of one screen, WxH')
+    ap.add_argument('--balls', type=int, default=1)
+    ap.add_argument('--ball-size', type=int, default=36)
+    ap.add_argument('--ball-collisions', action='store_true')
+    ap.add_argument('--speed', type=float, default=5.0)
+    ap.add_argument('--seed', type=int, default=None)
+    ap.add_argument('--fps', type=int, choices=TARGET_FPS_CHOICES, default=DEFAULT_FPS)
+    ap.add_argument('--crt', nargs='*', default=(), help='CRT effects for every screen (vignette, curvature)')
+    return ap.parse_args(argv)
+
+
+def main():
+    args = parse_args()
+    cols, rows = (int(v) for v in args.grid.lower().split('x'))
+    tw, th = (int(v) for v in args.tile.lower().split('x'))
+    shared = SharedBalls(args.balls)
+    stop = mp.Event()
+    sim_proc = mp.Process(target=run_simulation, daemon=True,
+                          args=(shared.name, args.balls, cols * tw, rows * th, args.ball_size, args.seed,
+                                args.speed, stop, args.ball_collisions))
+    viewers = [mp.Process(target=run_viewport,
+                          args=(shared.name, args.balls, (c * tw, r * th, tw, th), (c * tw, r * th), args.fps, args.crt))
+               for r in range(rows) for c in range(cols)]
+    sim_proc.start()
+    for p in viewers:
+        p.start()
+    try:
+        for p in viewers:
+            p.join()
+    except KeyboardInterrupt:
+        for p in viewers:
+            p.terminate()
+    finally:
+        stop.set()
+        sim_proc.join(timeout=2)
+        shared.close()
+        shared.unlink()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
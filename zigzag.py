@@ -7,74 +7,68 @@ Features:
   - Speed Boost System & Trail System (Tail) dynamic response according to speed
 """
 
+import time
+_T_START = time.perf_counter()
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
-import time, math, random, json, os, sys
-from datetime import datetime
-
-PALET = [
-    "#000000", # 0: pure black
-    "#E40027", # 1: red
-    "#F8D034", # 2: yellow
-    "#264BCC", # 3: blue
-    "#2AA146", # 4: green
-    "#B3B4B6", # 5: light gray
-    "#2C2C2E", # 6: dark gray
-]
-
-DEFAULT_CANVAS_W = 800
-DEFAULT_CANVAS_H = 600
-DEFAULT_BALL_SIZE = 36
-DEFAULT_BASE_SPEED = 5.0
-BORDER_LAYER = 32
-INNER_THIN = BORDER_LAYER // 4
-SCANLINE_STEP = 3
-TRAIL_MAX = 30
+from tkinter import ttk
+import random, json, os, argparse
+import numpy as np
+from colors import bright_lut, blend_ramp
+from simulation import Simulation, SPEED_BOOST_FRAMES
+from trail import TrailBuffer, TrailPool, slot_layout
+from scanlines import ScanlineOverlay
+from screen import (THEMES, DEFAULT_CANVAS_W, DEFAULT_CANVAS_H, DEFAULT_BALL_SIZE, DEFAULT_BASE_SPEED,
+                    SCANLINE_STEP, SCANLINE_COLOR, TRAIL_MAX, frame_rects)
+from framelog import FrameLogWriter
+from replay import Recorder, Replay, KEYFRAME_INTERVAL
+from profiler import StageProfiler
+from render import RenderLayer
+from scheduler import FrameScheduler, FixedTimestep, DEFAULT_FPS, TARGET_FPS_CHOICES
+from governor import QualityGovernor, QUALITY_LEVELS, QUALITY_NAMES, quality_level
+from daytime import DailyWindow, DayScheduler, DEFAULT_SCHEDULES
+from framebuffer import Framebuffer, CRT_EFFECTS, hex_rgb, packed_rgb
+from timeline import Timeline, TextPopupPool, ease_out
+_T_IMPORTED = time.perf_counter()
+
 FRAME_SAVE_INTERVAL = 30
-SPEED_BOOST_FRAMES = 12
-SPEED_BOOST_MULT = 1.45
-SILENT_START = 22
-SILENT_END = 6
-SILENT_SPEED_DIV = 2.0
 FRAMES_DIR = 'frames_meta'
 CONFIG_DEFAULT_PATH = 'zigzag_config.json'
-
-os.makedirs(FRAMES_DIR, exist_ok=True)
-
-def quantized_color_random(solid_bright=False):
-    steps = [i*32 for i in range(8)]
-    def q():
-        v = random.choice(steps)
-        return 255 if (v == 224 and random.random() < 0.25) else v
-    r = q(); g = q(); b = q()
-    if solid_bright:
-        r = min(255, r + 40)
-        g = min(255, g + 40)
-        b = min(255, b + 40)
-    return f"#{r:02x}{g:02x}{b:02x}"
-
-def brighten_color(hex_color, factor=1.4):
-    c = hex_color.lstrip('#')
-    r = int(c[0:2], 16); g = int(c[2:4], 16); b = int(c[4:6], 16)
-    r = min(255, int(r * factor)); g = min(255, int(g * factor)); b = min(255, int(b * factor))
-    return f"#{r:02x}{g:02x}{b:02x}"
-
-def dim_color(hex_color, factor=0.6):
-    c = hex_color.lstrip('#')
-    r = int(c[0:2], 16); g = int(c[2:4], 16); b = int(c[4:6], 16)
-    r = max(0, int(r * factor)); g = max(0, int(g * factor)); b = max(0, int(b * factor))
-    return f"#{r:02x}{g:02x}{b:02x}"
+PROFILE_STAGES = ('physics', 'collision', 'ball', 'trail', 'backup', 'status')
+HUD_REFRESH = 15
+RENDERERS = ('canvas', 'framebuffer')
+STARTUP_LOG = os.path.join(FRAMES_DIR, 'startup.jsonl')
+STARTUP_LOG_BYTES = 64 * 1024
+# collision phrases: several can be on screen at once, each fades and rises over POPUP_FADE seconds
+POPUP_POOL = 6
+POPUP_FADE = 0.45
+POPUP_RISE = 14
+POPUP_RAMP = tuple(f"#{v:02x}{int(v*0.3):02x}{int(v*0.3):02x}" for v in (int(220 * i / 8) for i in range(8, 0, -1)))
+# the primary ball flashes bright on a hit and settles on its new colour as the speed boost runs out
+FLASH_STEPS = 8
+FLASH_DURATION = SPEED_BOOST_FRAMES / 60.0
+# while the window cannot be seen nothing is drawn; the simulation is advanced at this interval
+HIDDEN_TICK_MS = 1000
 
 class ZigZagApp:
-    def __init__(self, master):
+    def __init__(self, master, seed=None, record_path=None, replay_path=None, fps=DEFAULT_FPS,
+                 renderer='canvas', crt=(), wall=None, kiosk=False, startup_log=None):
         self.master = master
+        self.kiosk = kiosk
+        self.startup_log = startup_log
+        self.startup_marks = {'imported': _T_IMPORTED}
         master.title('ZigZag Retro — Full')
-        master.configure(bg=PALET[0])
-
-        try:
-            master.minsize(640, 480)
-        except:
-            pass
+        self.day = DayScheduler(master, {name: DailyWindow(*spec) for name, spec in DEFAULT_SCHEDULES.items()},
+                                self._on_schedule)
+        self.silent = self.day.states['silent']
+        self.theme = 'dark' if self.day.states['dark'] else 'light'
+        self.palette = THEMES[self.theme]
+        master.configure(bg=self.palette[0])
+
+        if wall is None:
+            try:
+                master.minsize(640, 480)
+            except:
+                pass
 
         self.is_running = True
         self.is_fullscreen = False
@@ -83,30 +77,96 @@ class ZigZagApp:
         self.base_speed = DEFAULT_BASE_SPEED
         self.ball_size = DEFAULT_BALL_SIZE
         self.max_trail_len = TRAIL_MAX
-
-        self.last_time = time.time()
-        self.canvas = tk.Canvas(master, bg=PALET[0], highlightthickness=0)
+        self.ball_count = 1
+        self.ball_collisions = False
+        # off unless a config turns it on: an existing install keeps its look
+        self.adaptive_quality = False
+        self.quality_floor = len(QUALITY_LEVELS) - 1
+        self.interp_cap = QUALITY_LEVELS[0].interp_cap
+        self.trail_frac = QUALITY_LEVELS[0].trail_frac
+
+        self.target_fps = fps
+        self.timestep = FixedTimestep()
+        self.scheduler = FrameScheduler(master, self._animate_loop, fps)
+        self.governor = QualityGovernor(1000.0 / fps, self.quality_floor)
+        self.replay = Replay(replay_path) if replay_path else None
+        self.wall = wall
+        if self.replay is None and record_path and seed is None:
+            seed = random.randrange(2**32)
+        self.seed = seed
+        self.recorder = None
+        self.canvas = tk.Canvas(master, bg=self.palette[0], highlightthickness=0)
+        self.draw = RenderLayer(self.canvas)
+        # 'framebuffer': balls, trail and scanlines are composited in NumPy and shown as one image item
+        self.framebuffer = Framebuffer(1, 1, crt) if renderer == 'framebuffer' else None
+        self.fb_photo = None
+        self.fb_item = None
         self.content_bbox = (0,0,DEFAULT_CANVAS_W,DEFAULT_CANVAS_H)
         self._init_ball()
-        self.trail = []
-        self.scan_ids = []
-        self.collision_text_id = None
+        if record_path and self.replay is None:
+            self.recorder = Recorder(record_path, self.sim, self.seed)
+        self.trail = TrailBuffer(self.max_trail_len)
+        self.trail_pool = TrailPool(self.draw, self.max_trail_len if self.framebuffer is None else 0)
+        self.scanlines = ScanlineOverlay(self.draw, SCANLINE_STEP, master=self.canvas)
+        # every timed effect (popup fades, hit flash) is a tween advanced once per frame
+        self.timeline = Timeline(time.perf_counter())
+        self.popups = None
+        self._ball_fill = None
         self.silent_text_id = None
         self.frame_counter = 0
-        self.speed_boost_timer = 0
+        # wall tiles would all append the same ball to one log (and delete each other's segments)
+        self.frame_log = FrameLogWriter(FRAMES_DIR) if wall is None else None
+        self.profiler = StageProfiler(PROFILE_STAGES)
+        self.hud_text_id = None
+        self.hud_bg_id = None
+        self._hud_counters = (0, 0, 0)
         self.collision_phrases = ['BOOM!', 'CLANK!', 'TOK!', 'BAM!', 'DING!']
 
-        self._build_control_bar()
+        self.speed_var = tk.DoubleVar(value=self.base_speed)
+        self.trail_var = tk.BooleanVar(value=self.show_trail)
+        self.scan_var = tk.BooleanVar(value=self.show_scanlines)
+        self.btn_pause = self.btn_full = self.status_label = None
+        self._status_key = None
+        self._bar_widgets = []
+        if kiosk:
+            # no control bar, no cursor, straight to fullscreen
+            try: master.configure(cursor='none')
+            except: pass
+            self.toggle_fullscreen()
+        elif wall is not None:
+            # wall tile: speed, balls and configs belong to the simulation process, so no controls
+            pass
+        else:
+            self._build_control_bar()
         self.canvas.pack(fill='both', expand=True)
 
         master.bind('<Key>', self._on_key)
+        # the window manager's close button must flush the frame log and the recording too
+        try: master.protocol('WM_DELETE_WINDOW', self.quit_app)
+        except: pass
+        self.frame_ids = []
+        self._layout_key = None
+        self._layout_pending = False
+        self._layout_idle_id = None
         self._root_resize_scheduled = False
-        master.bind('<Configure>', self._on_root_configure)
+        if wall is None:
+            master.bind('<Configure>', self._on_root_configure)
         self.canvas.bind('<Configure>', self._on_canvas_resize)
+        # minimized, fully covered or on another input: stop rendering until exposed again
+        self.unmapped = False
+        self.obscured = False
+        self.suspended = False
+        self._hidden_after = None
+        master.bind('<Unmap>', self._on_unmap, add='+')
+        master.bind('<Map>', self._on_map, add='+')
+        master.bind('<FocusIn>', self._on_focus_in, add='+')
+        master.bind('<FocusOut>', self._on_focus_out, add='+')
+        self.canvas.bind('<Visibility>', self._on_visibility)
 
         self.master.update_idletasks()
-        self._on_canvas_resize(None)
-        self._animate_loop()
+        self._layout()
+        self.scheduler.start()
+        self.day.start()
 
     def _on_root_configure(self, event):
         if self._root_resize_scheduled:
@@ -143,24 +203,54 @@ class ZigZagApp:
             pass
 
     def _init_ball(self):
-        self.ball_color = quantized_color_random(solid_bright=True)
-        self.ball_x = DEFAULT_CANVAS_W * 0.25
-        self.ball_y = DEFAULT_CANVAS_H * 0.4
-        angle = random.uniform(-0.9, 0.9)
-        dx = math.cos(angle); dy = math.sin(angle)
-        if abs(dx) < 0.2: dx = 0.2 if dx >=0 else -0.2
-        if abs(dy) < 0.2: dy = 0.2 if dy >=0 else -0.2
-        mag = math.hypot(dx, dy) or 1.0
-        self.dir_x = dx / mag
-        self.dir_y = dy / mag
-        self.ball_item_id = None
+        x0, y0, x1, y1 = self.content_bbox
+        if self.replay is not None:
+            self.sim = self.replay.sim
+            self.ball_count = self.sim.count
+            self.ball_size = self.sim.ball_size
+        elif self.wall is not None:
+            self.sim = self.wall
+            self.ball_count = self.sim.count
+            self.ball_size = self.sim.ball_size
+        else:
+            self.sim = Simulation(self.ball_count, x1 - x0, y1 - y0, self.ball_size, seed=self.seed,
+                                  ball_collisions=self.ball_collisions)
+        for iid in getattr(self, 'ball_item_ids', []):
+            try: self.draw.delete(iid)
+            except: pass
+        self.ball_item_ids = []
+        if hasattr(self, 'timeline'):
+            self.timeline.cancel('flash')
+        self._ball_fill = None
+        self.render_x, self.render_y = self.sim.x, self.sim.y
+        self._trail_from = None
+
+    # primary ball (index 0): carries the trail, collision text and status line
+    @property
+    def ball_x(self): return float(self.sim.x[0])
+
+    @property
+    def ball_y(self): return float(self.sim.y[0])
+
+    @property
+    def dir_x(self): return float(self.sim.dir_x[0])
+
+    @property
+    def dir_y(self): return float(self.sim.dir_y[0])
+
+    @property
+    def ball_color(self): return self.sim.color_hex(0)
+
+    @property
+    def speed_boost_timer(self): return int(self.sim.boost[0])
 
     def _build_control_bar(self):
-        frame = tk.Frame(self.master, bg=PALET[5], bd=0, relief='flat')
+        pal = self.palette
+        frame = tk.Frame(self.master, bg=pal[5], bd=0, relief='flat')
         frame.pack(side='bottom', fill='x')
         self.control_frame = frame
 
-        left_frame = tk.Frame(frame, bg=PALET[5])
+        left_frame = tk.Frame(frame, bg=pal[5])
         left_frame.pack(side='left', padx=6, pady=6)
         self.btn_pause = ttk.Button(left_frame, text='Pause', command=self.toggle_pause, width=10)
         self.btn_full = ttk.Button(left_frame, text='Fullscreen', command=self.toggle_fullscreen, width=12)
@@ -169,39 +259,34 @@ class ZigZagApp:
         self.btn_pause.pack(side='left', padx=6); self.btn_full.pack(side='left', padx=6)
         self.btn_save.pack(side='left', padx=6); self.btn_load.pack(side='left', padx=6)
 
-        middle_frame = tk.Frame(frame, bg=PALET[5])
+        middle_frame = tk.Frame(frame, bg=pal[5])
         middle_frame.pack(side='left', padx=12)
-        ttk.Label(middle_frame, text='Speed', background=PALET[5]).pack(side='left', padx=(0,4))
-        self.speed_var = tk.DoubleVar(value=self.base_speed)
+        speed_label = ttk.Label(middle_frame, text='Speed', background=pal[5])
+        speed_label.pack(side='left', padx=(0,4))
         self.speed_slider = ttk.Scale(middle_frame, from_=1.0, to=24.0, variable=self.speed_var, command=self._on_speed_change, length=180)
         self.speed_slider.pack(side='left', padx=6, pady=6)
 
-        self.trail_var = tk.BooleanVar(value=self.show_trail)
-        self.scan_var = tk.BooleanVar(value=self.show_scanlines)
         self.trail_check = ttk.Checkbutton(middle_frame, text='Trail', variable=self.trail_var, command=self._on_toggle_trail)
         self.scan_check = ttk.Checkbutton(middle_frame, text='Scanlines', variable=self.scan_var, command=self._on_toggle_scan)
         self.trail_check.pack(side='left', padx=8); self.scan_check.pack(side='left', padx=8)
 
-        right_frame = tk.Frame(frame, bg=PALET[5])
+        right_frame = tk.Frame(frame, bg=pal[5])
         right_frame.pack(side='right', padx=6)
-        self.status_label = tk.Label(right_frame, text='Memulai...', bg=PALET[5], anchor='w', font=('Consolas',9))
+        self.status_label = tk.Label(right_frame, text='Memulai...', bg=pal[5], anchor='w', font=('Consolas',9))
         self.status_label.pack(side='right')
+        self._bar_widgets = [(w, 'bg') for w in (frame, left_frame, middle_frame, right_frame, self.status_label)]
+        self._bar_widgets.append((speed_label, 'background'))
 
     def _on_toggle_trail(self):
         self.show_trail = bool(self.trail_var.get())
         if not self.show_trail:
-            self.trail = []
-            self.canvas.delete('trail')
+            self.trail.clear()
+            self.trail_pool.hide_all()
+            self._trail_from = None
 
     def _on_toggle_scan(self):
         self.show_scanlines = bool(self.scan_var.get())
-        if self.show_scanlines:
-            self._create_scanlines()
-        else:
-            for sid in getattr(self, 'scan_ids', []):
-                try: self.canvas.delete(sid)
-                except: pass
-            self.scan_ids = []
+        self.scanlines.set_visible(self.show_scanlines and self.framebuffer is None)
 
     def _on_speed_change(self, v):
         try:
@@ -221,16 +306,38 @@ class ZigZagApp:
             self.trail_var.set(not self.trail_var.get()); self._on_toggle_trail()
         elif k == 's':
             self.scan_var.set(not self.scan_var.get()); self._on_toggle_scan()
+        elif k == 'p':
+            self.toggle_profiler()
+        elif k == 'e':
+            self.export_profile()
+        elif self.replay is not None and k in ('left', 'right', 'home'):
+            target = 0 if k == 'home' else self.replay.frame + (KEYFRAME_INTERVAL if k == 'right' else -KEYFRAME_INTERVAL)
+            self.seek(target)
+
+    def seek(self, frame):
+        self.frame_counter = self.replay.seek(frame)
+        self.trail.clear()
+        self.trail_pool.hide_all()
+        self._trail_from = None
+        self.render_x, self.render_y = self.sim.x, self.sim.y
+        self._update_ball_canvas_coords()
 
     def save_config(self):
         cfg = {
             'base_speed': self.base_speed,
             'ball_size': self.ball_size,
+            'ball_count': self.ball_count,
+            'ball_collisions': self.ball_collisions,
+            'target_fps': self.target_fps,
+            'adaptive_quality': self.adaptive_quality,
+            'quality_floor': QUALITY_NAMES[self.quality_floor],
             'show_trail': self.show_trail,
             'show_scanlines': self.show_scanlines,
+            'schedules': {name: (w.to_config() if w is not None else None) for name, w in self.day.windows.items()},
             'canvas_w': self.content_bbox[2] - self.content_bbox[0],
             'canvas_h': self.content_bbox[3] - self.content_bbox[1],
         }
+        from tkinter import filedialog, messagebox
         fname = filedialog.asksaveasfilename(title='Simpan Konfigurasi', defaultextension='.json', filetypes=[('JSON files','*.json')])
         if not fname:
             return
@@ -242,29 +349,134 @@ class ZigZagApp:
             messagebox.showerror('Error', f'Gagal menyimpan konfigurasi: {e}')
 
     def load_config(self):
+        from tkinter import filedialog, messagebox
         fname = filedialog.askopenfilename(title='Muat Konfigurasi', filetypes=[('JSON files','*.json')])
         if not fname:
             return
         try:
-            with open(fname, 'r', encoding='utf-8') as f:
-                cfg = json.load(f)
-            self.base_speed = float(cfg.get('base_speed', self.base_speed))
-            self.ball_size = int(cfg.get('ball_size', self.ball_size))
-            self.show_trail = bool(cfg.get('show_trail', self.show_trail))
-            self.show_scanlines = bool(cfg.get('show_scanlines', self.show_scanlines))
-            w = int(cfg.get('canvas_w', self.content_bbox[2]-self.content_bbox[0]))
-            h = int(cfg.get('canvas_h', self.content_bbox[3]-self.content_bbox[1]))
-            self.speed_var.set(self.base_speed)
-            self.trail_var.set(self.show_trail)
-            self.scan_var.set(self.show_scanlines)
-            self._place_canvas_with_ratio(w, h)
+            self.load_config_file(fname)
             messagebox.showinfo('Muat Konfigurasi', 'Konfigurasi dimuat.')
         except Exception as e:
             messagebox.showerror('Error', f'Gagal memuat konfigurasi: {e}')
 
+    def load_config_file(self, fname):
+        with open(fname, 'r', encoding='utf-8') as f:
+            cfg = json.load(f)
+        self.apply_config(cfg)
+
+    def apply_config(self, cfg):
+        self.base_speed = float(cfg.get('base_speed', self.base_speed))
+        # a replay (and a wall viewer) shows another simulation: only its own events may change it
+        owns_sim = self.replay is None and self.wall is None
+        if owns_sim:
+            self.ball_size = int(cfg.get('ball_size', self.ball_size))
+            self.ball_collisions = bool(cfg.get('ball_collisions', self.ball_collisions))
+            self.sim.ball_size = self.ball_size
+            self.sim.ball_collisions = self.ball_collisions
+            if self.recorder is not None:
+                self.recorder.set_ball_size(self.ball_size)
+                self.recorder.set_ball_collisions(self.ball_collisions)
+        fps = int(cfg.get('target_fps', self.target_fps))
+        if fps in TARGET_FPS_CHOICES:
+            self.set_target_fps(fps)
+        self.adaptive_quality = bool(cfg.get('adaptive_quality', self.adaptive_quality))
+        try:
+            self.quality_floor = quality_level(cfg.get('quality_floor', self.quality_floor))
+        except ValueError as e:
+            print('Config error:', e)
+        level = self.governor.set_floor(self.quality_floor)
+        if not self.adaptive_quality:
+            self.governor.level = 0
+            level = 0
+        if level is not None:
+            self._apply_quality(level)
+        ball_count = max(1, int(cfg.get('ball_count', self.ball_count)))
+        if ball_count != self.ball_count and owns_sim:
+            if self.recorder is not None:
+                print('Ball count changed, recording stopped at frame', self.recorder.frame)
+                self.recorder.close()
+                self.recorder = None
+            self.ball_count = ball_count
+            self._init_ball()
+            self._layout(force=True)
+        self.show_trail = bool(cfg.get('show_trail', self.show_trail))
+        self.show_scanlines = bool(cfg.get('show_scanlines', self.show_scanlines))
+        if 'schedules' in cfg:
+            windows = dict(self.day.windows)
+            windows.update({name: DailyWindow.from_config(spec) for name, spec in cfg['schedules'].items()
+                            if name in DEFAULT_SCHEDULES})
+            self.day.set_windows(windows)
+        w = int(cfg.get('canvas_w', self.content_bbox[2]-self.content_bbox[0]))
+        h = int(cfg.get('canvas_h', self.content_bbox[3]-self.content_bbox[1]))
+        self.speed_var.set(self.base_speed)
+        self.trail_var.set(self.show_trail)
+        self.scan_var.set(self.show_scanlines)
+        self._on_toggle_trail()
+        self._on_toggle_scan()
+        self._place_canvas_with_ratio(w, h)
+
     def toggle_pause(self):
         self.is_running = not self.is_running
-        self.btn_pause.config(text='Resume' if not self.is_running else 'Pause')
+        if self.btn_pause is not None:
+            self.draw.config(self.btn_pause, text='Resume' if not self.is_running else 'Pause')
+        if self.is_running:
+            self.timestep.reset()
+            self.timeline.reset(time.perf_counter())
+            if not self.suspended:
+                self.scheduler.start()
+            elif self._hidden_after is None:
+                self._hidden_after = self.master.after(HIDDEN_TICK_MS, self._hidden_tick)
+        else:
+            self.scheduler.stop()
+            self._status_key = None
+            try:
+                self.draw.config(self.status_label, text=f"Paused | Frame:{self.frame_counter}")
+            except:
+                pass
+
+    def set_target_fps(self, fps):
+        self.target_fps = fps
+        self.scheduler.set_fps(fps)
+        self.governor.set_budget(1000.0 / fps)
+
+    def _apply_quality(self, level):
+        q = QUALITY_LEVELS[level]
+        self.interp_cap = q.interp_cap
+        self.trail_frac = q.trail_frac
+        self.scanlines.set_step(SCANLINE_STEP * q.scan_mult)
+        self.trail_pool.set_detail(q.dim_levels)
+
+    def _on_schedule(self, changed):
+        # called by DayScheduler only at a schedule boundary, with every changed state at once
+        if 'dark' in changed:
+            self._apply_theme('dark' if changed['dark'] else 'light')
+        if 'silent' in changed and self.replay is None and self.wall is None:
+            self.silent = changed['silent']
+            self._show_silent()
+
+    def _show_silent(self):
+        try: self.draw.itemconfig(self.silent_text_id, text='[Silent Mode]' if self.silent else '')
+        except: pass
+
+    def _apply_theme(self, name):
+        if name == self.theme:
+            return
+        self.theme = name
+        pal = self.palette = THEMES[name]
+        try:
+            self.draw.config(self.master, bg=pal[0])
+            self.draw.config(self.canvas, bg=pal[0])
+            for widget, opt in self._bar_widgets:
+                self.draw.config(widget, **{opt: pal[5]})
+            for iid, col in zip(self.frame_ids, pal):
+                self.draw.itemconfig(iid, fill=col)
+            if self.silent_text_id is not None:
+                self.draw.itemconfig(self.silent_text_id, fill=pal[7])
+            if self.hud_text_id is not None:
+                self.draw.itemconfig(self.hud_bg_id, fill=pal[0], outline=pal[5])
+                self.draw.itemconfig(self.hud_text_id, fill=pal[5])
+        except:
+            pass
 
     def toggle_fullscreen(self):
         self.is_fullscreen = not self.is_fullscreen
@@ -272,104 +484,241 @@ class ZigZagApp:
             self.master.attributes('-fullscreen', self.is_fullscreen)
         except Exception:
             pass
-        self.btn_full.config(text='Exit Fullscreen' if self.is_fullscreen else 'Fullscreen')
+        if self.btn_full is not None:
+            self.draw.config(self.btn_full, text='Exit Fullscreen' if self.is_fullscreen else 'Fullscreen')
+
+    def toggle_profiler(self):
+        if self.profiler.toggle():
+            self._update_hud()
+        else:
+            for iid in (self.hud_bg_id, self.hud_text_id):
+                try: self.draw.itemconfig(iid, state='hidden')
+                except: pass
+
+    def export_profile(self):
+        if not self.profiler.frames:
+            return
+        fname = os.path.join(FRAMES_DIR, f"profile_{time.strftime('%Y%m%d_%H%M%S')}.json")
+        try:
+            os.makedirs(FRAMES_DIR, exist_ok=True)
+            self.profiler.export(fname)
+            print('Profile exported:', fname)
+        except Exception as e:
+            print('Profile export error:', e)
+
+    def _update_hud(self):
+        x0, y0, x1, y1 = self.content_bbox
+        sent, skipped = self.draw.stats()
+        last_frame, last_sent, last_skipped = self._hud_counters
+        frames = max(1, self.frame_counter - last_frame)
+        self._hud_counters = (self.frame_counter, sent, skipped)
+        text = (self.profiler.hud_text() +
+                f"\ntk calls  {(sent - last_sent) / frames:5.1f} sent {(skipped - last_skipped) / frames:5.1f} skipped /frame")
+        try:
+            if self.hud_text_id is None:
+                self.hud_bg_id = self.draw.create_rectangle(0, 0, 0, 0, fill=self.palette[0], outline=self.palette[5], tags='hud')
+                self.hud_text_id = self.draw.create_text(0, 0, anchor='ne', fill=self.palette[5], font=('Consolas', 9), tags='hud')
+            self.draw.coords(self.hud_text_id, x1 - 10, y0 + 10)
+            self.draw.itemconfig(self.hud_text_id, text=text, state='normal')
+            bx0, by0, bx1, by1 = self.draw.bbox(self.hud_text_id)
+            self.draw.coords(self.hud_bg_id, bx0 - 4, by0 - 4, bx1 + 4, by1 + 4)
+            self.draw.itemconfig(self.hud_bg_id, state='normal')
+        except:
+            pass
+
+    def _log_startup(self):
+        # runs once, after Tk has drawn the first frame
+        self.startup_marks['first_frame'] = time.perf_counter()
+        phases = {k: round((t - _T_START) * 1000.0, 1) for k, t in self.startup_marks.items()}
+        record = {
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'ttff_ms': phases['first_frame'],
+            'phases_ms': phases,
+            'kiosk': self.kiosk,
+            'renderer': 'canvas' if self.framebuffer is None else 'framebuffer',
+        }
+        print(f"Time to first frame: {record['ttff_ms']:.1f} ms", phases)
+        try:
+            os.makedirs(os.path.dirname(self.startup_log) or '.', exist_ok=True)
+            # one previous generation is kept as <log>.1
+            if os.path.exists(self.startup_log) and os.path.getsize(self.startup_log) >= STARTUP_LOG_BYTES:
+                os.replace(self.startup_log, self.startup_log + '.1')
+            with open(self.startup_log, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record) + '\n')
+        except OSError as e:
+            print('Startup log error:', e)
 
     def quit_app(self):
+        self.day.stop()
+        if self._hidden_after is not None:
+            try: self.master.after_cancel(self._hidden_after)
+            except: pass
+        if self.frame_log is not None:
+            self.frame_log.close()
+        if self.recorder is not None:
+            self.recorder.close()
         self.master.quit()
 
+    def _on_unmap(self, event):
+        # <Unmap> of child widgets reaches the toplevel binding too
+        if event.widget is self.master:
+            self.unmapped = True
+            self._update_visibility()
+
+    def _on_map(self, event):
+        if event.widget is self.master:
+            self.unmapped = False
+            self._update_visibility()
+
+    def _on_visibility(self, event):
+        self.obscured = str(event.state) == 'VisibilityFullyObscured'
+        self._update_visibility()
+
+    def _on_focus_in(self, event):
+        # a window that gets focus can be seen; not every window manager reports <Visibility>
+        if self.unmapped or self.obscured:
+            self.unmapped = self.obscured = False
+            self._update_visibility()
+
+    def _on_focus_out(self, event):
+        try: viewable = self.master.winfo_viewable()
+        except: return
+        if not viewable and not self.unmapped:
+            self.unmapped = True
+            self._update_visibility()
+
+    def _update_visibility(self):
+        hidden = self.unmapped or self.obscured
+        if hidden == self.suspended:
+            return
+        if hidden:
+            self._suspend()
+        else:
+            self._resume()
+
+    def _suspend(self):
+        self.suspended = True
+        self.scheduler.stop()
+        if self.is_running:
+            self._hidden_after = self.master.after(HIDDEN_TICK_MS, self._hidden_tick)
+
+    def _resume(self):
+        self.suspended = False
+        if self._hidden_after is not None:
+            try: self.master.after_cancel(self._hidden_after)
+            except: pass
+            self._hidden_after = None
+        if not self.is_running:
+            return
+        self._catch_up(time.perf_counter())
+        # no trail streak across the jump; every oval gets its current colour, whether it
+        # bounced during this catch-up or during an earlier hidden tick
+        self.trail.clear()
+        self._trail_from = None
+        self._update_ball_canvas_coords()
+        self.scheduler.start()
+
+    def _hidden_tick(self):
+        self._hidden_after = None
+        # paused: no wakeups at all; toggle_pause() re-arms the tick on resume
+        if not self.suspended or not self.is_running:
+            return
+        self._catch_up(time.perf_counter())
+        self._hidden_after = self.master.after(HIDDEN_TICK_MS, self._hidden_tick)
+
+    def _catch_up(self, now):
+        """Advances the simulation to `now` without drawing anything."""
+        steps = self.timestep.catch_up(now)
+        dt = self.timestep.step
+        if not steps or self.wall is not None:
+            # wall mode: the simulation process keeps running, the next frame pulls its state
+            return
+        if self.replay is not None:
+            for _ in range(steps):
+                if self.replay.advance() is None:
+                    self.toggle_pause()
+                    break
+            self.frame_counter = self.replay.frame
+        elif self.recorder is not None:
+            # a recording has to log every step for the replay to stay exact
+            for _ in range(steps):
+                self.recorder.step(dt, self.base_speed, self.silent)
+                self.sim.step(dt, self.base_speed, self.silent)
+        else:
+            self.sim.fast_forward(steps, dt, self.base_speed, self.silent)
+        self.render_x, self.render_y = self.sim.interpolate(self.timestep.alpha)
+
     def _on_canvas_resize(self, event):
+        # <Configure> bursts are coalesced: the layout runs once at the start of the next frame
+        self._layout_pending = True
+        if not self.scheduler.running and self._layout_idle_id is None:
+            self._layout_idle_id = self.master.after_idle(self._layout)
+
+    def _layout(self, force=False):
+        self._layout_pending = False
+        self._layout_idle_id = None
         w = max(1, self.canvas.winfo_width())
         h = max(1, self.canvas.winfo_height())
 
-        target_w = min(w, int(h * 4.0 / 3.0))
-        target_h = int(target_w * 3.0 / 4.0)
-        if target_w < 4:
-            target_w = 4
-            target_h = 3
-        x0 = (w - target_w)//2
-        y0 = (h - target_h)//2
-        x1 = x0 + target_w
-        y1 = y0 + target_h
+        if self.wall is not None:
+            # wall tile: the whole canvas is this screen's slice of the shared world, 1:1, no border
+            x0, y0, x1, y1 = 0, 0, w, h
+            rects = [(0, 0, w, h)] * 7
+        else:
+            (x0, y0, x1, y1), rects = frame_rects(w, h)
+        if not force and (w, h, (x0, y0, x1, y1)) == self._layout_key:
+            return
+        self._layout_key = (w, h, (x0, y0, x1, y1))
         self.content_bbox = (x0, y0, x1, y1)
 
-        self.canvas.delete('border')
-        self.canvas.delete('content')
-        for sid in getattr(self, 'scan_ids', []):
-            try: self.canvas.delete(sid)
-            except: pass
-        self.scan_ids = []
-
-        self.canvas.create_rectangle(0, 0, w, h, fill=PALET[0], outline='', tags='border')
-
-        colors = [PALET[1], PALET[2], PALET[3], PALET[4]]
-        multipliers = [4, 3, 2, 1]
-        for mul, col in zip(multipliers, colors):
-            bx0 = x0 - BORDER_LAYER * mul
-            by0 = y0 - BORDER_LAYER * mul
-            bx1 = x1 + BORDER_LAYER * mul
-            by1 = y1 + BORDER_LAYER * mul
-            bx0 = max(0, bx0); by0 = max(0, by0)
-            bx1 = min(w, bx1); by1 = min(h, by1)
-            self.canvas.create_rectangle(bx0, by0, bx1, by1, fill=col, outline='', tags='border')
-
-        inner_bx0 = x0 - INNER_THIN
-        inner_by0 = y0 - INNER_THIN
-        inner_bx1 = x1 + INNER_THIN
-        inner_by1 = y1 + INNER_THIN
-        inner_bx0 = max(0, inner_bx0); inner_by0 = max(0, inner_by0)
-        inner_bx1 = min(w, inner_bx1); inner_by1 = min(h, inner_by1)
-        self.canvas.create_rectangle(inner_bx0, inner_by0, inner_bx1, inner_by1, fill=PALET[5], outline='', tags='border')
-
-        self.canvas.create_rectangle(x0, y0, x1, y1, fill=PALET[6], outline='', tags='content')
-
-        if self.show_scanlines:
-            self._create_scanlines()
+        created = not self.frame_ids
+        if created:
+            colors = self.palette[:7]
+            tags = ['border'] * 6 + ['content']
+            self.frame_ids = [self.draw.create_rectangle(*r, fill=col, outline='', tags=tag)
+                              for r, col, tag in zip(rects, colors, tags)]
         else:
-            for sid in getattr(self, 'scan_ids', []):
-                try:
-                    self.canvas.delete(sid)
-                except:
-                    pass
-            self.scan_ids = []
+            for iid, r in zip(self.frame_ids, rects):
+                self.draw.coords(iid, *r)
 
-        if self.silent_text_id is None:
-            self.silent_text_id = self.canvas.create_text(x0+8, y0+8, anchor='nw', text='', fill='#ffffff', font=('Consolas',10,'bold'), tags='overlay')
-        else:
-            self.canvas.coords(self.silent_text_id, x0+8, y0+8)
+        self.scanlines.place(self.content_bbox, self.show_scanlines and self.framebuffer is None)
 
-        if self.collision_text_id is None:
-            self.collision_text_id = self.canvas.create_text(x0+10, y0+10, text='', state='hidden', font=('Consolas',14,'bold'), tags='overlay')
+        if self.silent_text_id is None:
+            self.silent_text_id = self.draw.create_text(x0+8, y0+8, anchor='nw', text='[Silent Mode]' if self.silent else '', fill=self.palette[7], font=('Consolas',10,'bold'), tags='overlay')
         else:
-            self._position_collision_text()
-
-        if self.ball_item_id is None:
-            self.ball_item_id = self.canvas.create_oval(0,0,0,0, fill=self.ball_color, outline='', tags='ball')
-
-        cw = max(1, x1-x0); ch = max(1, y1-y0)
-        if self.ball_x > cw - self.ball_size:
-            self.ball_x = max(0, cw - self.ball_size)
-        if self.ball_y > ch - self.ball_size:
-            self.ball_y = max(0, ch - self.ball_size)
+            self.draw.coords(self.silent_text_id, x0+8, y0+8)
+
+        if self.popups is None:
+            self.popups = TextPopupPool(self.draw, POPUP_POOL, 'overlay', font=('Consolas',14,'bold'))
+
+        if self.framebuffer is not None:
+            created |= self._layout_framebuffer()
+        elif not self.ball_item_ids:
+            self.ball_item_ids = [self.draw.create_oval(0,0,0,0, fill=self.sim.color_hex(i), outline='', tags='ball')
+                                  for i in range(self.sim.count)]
+            created = True
+
+        if self.replay is None:
+            self.sim.resize(max(1, x1-x0), max(1, y1-y0))
+            if self.recorder is not None:
+                self.recorder.resize(self.sim.width, self.sim.height)
+        self.render_x, self.render_y = self.sim.interpolate(self.timestep.alpha)
         self._update_ball_canvas_coords()
+        if self.profiler.enabled:
+            self._update_hud()
+        if created:
+            self._restack_items()
+
+    def _restack_items(self):
+        for tag in ('framebuffer', 'scan_line', 'overlay', 'ball', 'trail', 'hud'):
+            try: self.draw.tag_raise(tag)
+            except: pass
 
     def _place_canvas_with_ratio(self, w, h):
         self.master.update_idletasks()
         return
 
-    def _create_scanlines(self):
-        for sid in getattr(self, 'scan_ids', []):
-            try: self.canvas.delete(sid)
-            except: pass
-        self.scan_ids = []
-        x0, y0, x1, y1 = self.content_bbox
-        step = max(1, SCANLINE_STEP)
-        for yy in range(y0, y1, step):
-            sid = self.canvas.create_line(x0, yy, x1, yy, fill='#0b0b0b', width=1, tags='scan_line')
-            self.scan_ids.append(sid)
-
-    def _position_collision_text(self):
-        if self.collision_text_id is None:
-            return
+    def _collision_text_pos(self):
         x0, y0, x1, y1 = self.content_bbox
         gx, gy = self.local_to_global(self.ball_x, self.ball_y)
         if gy - y0 > 28:
@@ -378,177 +727,249 @@ class ZigZagApp:
         else:
             tx = gx + self.ball_size/2
             ty = gy + self.ball_size + 18
-        try:
-            self.canvas.coords(self.collision_text_id, tx, ty)
-        except:
-            pass
+        return tx, ty
 
     def _show_collision_near(self, text):
-        self._position_collision_text()
-        try:
-            self.canvas.itemconfig(self.collision_text_id, text=text, fill=PALET[5], state='normal')
-        except:
-            pass
-        steps = 8
-        duration = 450
-        def fade(i=steps):
-            if i <= 0:
-                try: self.canvas.itemconfig(self.collision_text_id, state='hidden')
-                except: pass
-                return
-            val = int(220 * (i/steps))
-            col = f"#{val:02x}{int(val*0.3):02x}{int(val*0.3):02x}"
+        if self.popups is None:
+            return
+        iid = self.popups.acquire(self.timeline)
+        tx, ty = self._collision_text_pos()
+        ramp = (self.palette[5],) + POPUP_RAMP
+        def update(t):
             try:
-                self.canvas.itemconfig(self.collision_text_id, fill=col)
+                self.draw.coords(iid, tx, round(ty - POPUP_RISE * t))
+                self.draw.itemconfig(iid, fill=ramp[min(len(ramp) - 1, int(t * len(ramp)))])
+            except: pass
+        try: self.draw.itemconfig(iid, text=text, state='normal')
+        except: pass
+        key = self.timeline.add(POPUP_FADE, update, done=lambda: self.popups.release(iid), ease=ease_out)
+        self.popups.bind(iid, key)
+
+    def _flash_ball(self):
+        """Hit flash of the primary ball: bright version of its new colour, blended back over FLASH_DURATION."""
+        color = self.sim.color_hex(0)
+        ramp = blend_ramp(bright_lut(color, 1.6), color, FLASH_STEPS)
+        def update(t):
+            self._set_ball_fill(ramp[min(FLASH_STEPS - 1, int(t * FLASH_STEPS))])
+        self.timeline.add(FLASH_DURATION, update, done=lambda: self._set_ball_fill(None), key='flash')
+
+    def _set_ball_fill(self, color):
+        # framebuffer mode picks _ball_fill up in the next blit
+        self._ball_fill = color
+        if self.framebuffer is None and self.ball_item_ids:
+            try: self.draw.itemconfig(self.ball_item_ids[0], fill=color or self.sim.color_hex(0))
             except: pass
-            self.master.after(int(duration/steps), lambda: fade(i-1))
-        fade()
 
     def local_to_global(self, lx, ly):
         x0, y0, x1, y1 = self.content_bbox
         return x0 + lx, y0 + ly
 
-    def _update_ball_canvas_coords(self):
-        gx, gy = self.local_to_global(self.ball_x, self.ball_y)
+    def _layout_framebuffer(self):
+        x0, y0, x1, y1 = self.content_bbox
+        self.framebuffer.resize(x1 - x0, y1 - y0)
+        self.fb_photo = tk.PhotoImage(master=self.canvas, width=x1 - x0, height=y1 - y0)
+        if self.fb_item is None:
+            self.fb_item = self.draw.create_image(x0, y0, anchor='nw', image=self.fb_photo, tags='framebuffer')
+            return True
+        self.draw.coords(self.fb_item, x0, y0)
+        self.draw.itemconfig(self.fb_item, image=self.fb_photo)
+        return False
+
+    def _blit_framebuffer(self):
+        fb = self.framebuffer
+        half = self.ball_size / 2
+        fb.clear(self.palette[6], self.scanlines.step if self.show_scanlines else 0, SCANLINE_COLOR)
+        rgb = packed_rgb(self.sim.color)
+        if self._ball_fill is not None:
+            rgb[0] = hex_rgb(self._ball_fill)
+        fb.discs(self.render_x + half, self.render_y + half, np.full(self.sim.count, half), rgb)
+        if self.show_trail and len(self.trail):
+            pool = self.trail_pool
+            layout = slot_layout(len(self.trail), self.ball_size, pool.detail, pool.levels)
+            cx, cy, r, rgb = zip(*[(tx + half, ty + half, rad, hex_rgb(pool.ramp(tcol)[level]))
+                                   for (tx, ty, tcol), (rad, level) in zip(self.trail, layout)])
+            fb.discs(cx, cy, r, rgb)
         try:
-            self.canvas.coords(self.ball_item_id, gx, gy, gx + self.ball_size, gy + self.ball_size)
-            self.canvas.itemconfig(self.ball_item_id, fill=self.ball_color)
+            self.fb_photo.configure(data=fb.ppm(), format='PPM')
         except:
             pass
 
-    def _backup_frame(self):
+    def _update_ball_canvas_coords(self, recolor=None):
+        if self.framebuffer is not None:
+            self._blit_framebuffer()
+            return
+        x0, y0, x1, y1 = self.content_bbox
+        size = self.ball_size
+        ids = self.ball_item_ids
         try:
-            idx = self.frame_counter // FRAME_SAVE_INTERVAL
-            fname = os.path.join(FRAMES_DIR, f"frame_{idx:04d}.txt")
-            with open(fname, 'w', encoding='utf-8') as f:
-                f.write(f"[Frame {self.frame_counter} | {datetime.now()}]\n")
-                f.write(f"Ball Pos: ({self.ball_x:.2f}, {self.ball_y:.2f})\n")
-                f.write(f"Dir: ({self.dir_x:.3f}, {self.dir_y:.3f})\n")
-                f.write(f"Color: {self.ball_color}\n")
-        except Exception as e:
-            print('Backup frame error:', e)
+            for iid, gx, gy in zip(ids, (self.render_x + x0).tolist(), (self.render_y + y0).tolist()):
+                self.draw.coords(iid, gx, gy, gx + size, gy + size)
+            changed = range(len(ids)) if recolor is None else recolor.nonzero()[0].tolist()
+            for i in changed:
+                # ball 0's fill belongs to the hit flash while it runs
+                if i or self._ball_fill is None:
+                    self.draw.itemconfig(ids[i], fill=self.sim.color_hex(i))
+        except:
+            pass
 
-    def _animate_loop(self):
-        if not getattr(self.master, 'winfo_exists', lambda: True)():
+    def _backup_frame(self):
+        self.frame_log.log({
+            'frame': self.frame_counter,
+            'time': round(time.time(), 3),
+            'pos': [round(self.ball_x, 2), round(self.ball_y, 2)],
+            'dir': [round(self.dir_x, 3), round(self.dir_y, 3)],
+            'color': self.ball_color,
+        })
+
+    def _update_status(self, eff_speed, silent):
+        if self.status_label is None:
             return
+        # only values that change on events (bounce, boost, slider, silent mode, governor), never per
+        # frame, so the label is rebuilt and sent only when something actually changed
+        boost = self.speed_boost_timer > 0
+        decision = self.governor.last_decision if self.adaptive_quality else ''
+        key = (self.dir_x, self.dir_y, round(eff_speed, 1), self.sim.count, silent, boost, decision)
+        if key == self._status_key:
+            return
+        self._status_key = key
+        status = f"Dir:({self.dir_x:.2f},{self.dir_y:.2f}) Speed:{eff_speed:.1f}"
+        if self.sim.count > 1:
+            status += f' | Balls:{self.sim.count}'
+        if silent:
+            status += ' | SILENT'
+        if boost:
+            status += ' | BOOST'
+        if decision:
+            status += f' | {decision}'
+        try:
+            self.draw.config(self.status_label, text=status)
+        except:
+            pass
 
-        now = time.time()
-        dt = now - getattr(self, 'last_time', now)
-        if dt > 0.5: dt = 1.0/60.0
-        self.last_time = now
-
-        if not self.is_running:
-            try:
-                self.status_label.config(text=f"Paused | Frame:{self.frame_counter}")
-            except:
-                pass
-            self.master.after(100, self._animate_loop)
+    def _animate_loop(self, now=None):
+        if not getattr(self.master, 'winfo_exists', lambda: True)():
+            self.scheduler.stop()
             return
+        t_start = time.perf_counter()
+        if now is None:
+            now = t_start
+        steps = self.timestep.advance(now)
+        dt = self.timestep.step
 
         self.frame_counter += 1
-
-        eff_speed = self.base_speed
-        if self.speed_boost_timer > 0:
-            eff_speed *= SPEED_BOOST_MULT
-            self.speed_boost_timer -= 1
-
-        hr = datetime.now().hour
-        if (hr >= SILENT_START) or (hr < SILENT_END):
-            eff_speed /= SILENT_SPEED_DIV
-            try: self.canvas.itemconfig(self.silent_text_id, text='[Silent Mode]')
-            except: pass
+        if self.startup_log and 'first_frame' not in self.startup_marks:
+            self.startup_marks['first_frame'] = 0.0
+            self.master.after_idle(self._log_startup)
+        prof = self.profiler
+        prof.begin()
+        if self._layout_pending:
+            self._layout()
+
+        silent = self.silent
+        collided = np.zeros(self.sim.count, dtype=bool)
+        if self.replay is not None:
+            for _ in range(steps):
+                hits = self.replay.advance()
+                if hits is None:
+                    self.toggle_pause()
+                    break
+                collided |= hits
+            silent = self.replay.silent
+            self.frame_counter = self.replay.frame
+        elif self.wall is not None:
+            # the simulation runs in another process; take whatever it published last
+            collided |= self.wall.pull()
+            self.ball_size = self.wall.ball_size
+            silent = self.wall.silent
         else:
-            try: self.canvas.itemconfig(self.silent_text_id, text='')
-            except: pass
-
-        move = eff_speed * dt * 60.0
-
-        prev_x, prev_y = self.ball_x, self.ball_y
-        nx = prev_x + move * self.dir_x
-        ny = prev_y + move * self.dir_y
-
+            for _ in range(steps):
+                if self.recorder is not None:
+                    self.recorder.step(dt, self.base_speed, silent)
+                collided |= self.sim.step(dt, self.base_speed, silent)
+        if silent != self.silent:
+            self.silent = silent
+            self._show_silent()
+        alpha = self.wall.alpha(time.monotonic()) if self.wall is not None else self.timestep.alpha
+        self.render_x, self.render_y = self.sim.interpolate(alpha)
+        prof.lap('physics')
+
+        eff_speed = float(self.sim.speed[0])
         x0, y0, x1, y1 = self.content_bbox
-        cw = max(1, x1 - x0)
-        ch = max(1, y1 - y0)
-
-        collided = False
 
-        if nx <= 0:
-            nx = 0; self.dir_x = abs(self.dir_x) or 1.0; collided = True
-        elif nx + self.ball_size >= cw:
-            nx = cw - self.ball_size; self.dir_x = -abs(self.dir_x) or -1.0; collided = True
-
-        if ny <= 0:
-            ny = 0; self.dir_y = abs(self.dir_y) or 1.0; collided = True
-        elif ny + self.ball_size >= ch:
-            ny = ch - self.ball_size; self.dir_y = -abs(self.dir_y) or -1.0; collided = True
-
-        self.ball_x, self.ball_y = nx, ny
-
-        if collided:
+        self.timeline.advance(now)
+        if collided[0]:
             phrase = random.choice(self.collision_phrases)
             self._show_collision_near(phrase)
-            self.speed_boost_timer = SPEED_BOOST_FRAMES
-            self.ball_color = quantized_color_random(solid_bright=True)
-            jitter = random.uniform(-0.35, 0.35)
-            nxv = self.dir_x + jitter * 0.25
-            nyv = self.dir_y - jitter * 0.25
-            mag = math.hypot(nxv, nyv) or 1.0
-            self.dir_x = nxv / mag
-            self.dir_y = nyv / mag
-
-        self._update_ball_canvas_coords()
-
-        dx = self.ball_x - prev_x; dy = self.ball_y - prev_y
-        dist = math.hypot(dx, dy)
-        if dist > 0 and self.show_trail:
-            interp_count = min(12, max(1, int(dist // 2)))
-            head_col = brighten_color(self.ball_color, factor=1.5)
-            mid_col = brighten_color(self.ball_color, factor=1.35)
-            for i in range(1, interp_count + 1):
-                t = i / (interp_count + 1)
-                ix = prev_x + dx * t; iy = prev_y + dy * t
-                col = mid_col if i < interp_count else head_col
-                self.trail.insert(0, (ix, iy, col))
-            self.trail.insert(0, (self.ball_x, self.ball_y, head_col))
-
-        if len(self.trail) > self.max_trail_len:
-            self.trail = self.trail[:self.max_trail_len]
-
-        self.canvas.delete('trail')
-        total = len(self.trail) if self.trail else 1
-        for idx, (tx, ty, tcol) in enumerate(self.trail):
-            age = idx / total
-            sz = self.ball_size * (0.85 - age * 0.6)
-            color = dim_color(tcol, factor=0.45 + (1.0 - age) * 0.55)
-            gx, gy = self.local_to_global(tx, ty)
-            try:
-                self.canvas.create_oval(gx + self.ball_size/2 - sz/2,
-                                        gy + self.ball_size/2 - sz/2,
-                                        gx + self.ball_size/2 + sz/2,
-                                        gy + self.ball_size/2 + sz/2,
-                                        fill=color, outline='', tags='trail')
-            except:
-                pass
+            self._flash_ball()
+        prof.lap('collision')
+
+        if self.framebuffer is None:
+            self._update_ball_canvas_coords(collided)
+        prof.lap('ball')
+
+        head_x = float(self.render_x[0]); head_y = float(self.render_y[0])
+        prev_x, prev_y = self._trail_from or (head_x, head_y)
+        self._trail_from = (head_x, head_y)
+        if self.show_trail:
+            self.trail.push_segment(prev_x, prev_y, head_x, head_y, self.ball_color, self.interp_cap)
+
+        trail_len = max(2, int(round(self.max_trail_len * self.trail_frac)))
+        if self.trail.maxlen != trail_len:
+            self.trail.resize(trail_len)
+            if self.framebuffer is None:
+                self.trail_pool.ensure(trail_len)
+
+        if self.framebuffer is None:
+            self.trail_pool.draw(self.trail, x0, y0, self.ball_size)
+        else:
+            self._blit_framebuffer()
+        prof.lap('trail')
 
-        if self.frame_counter % FRAME_SAVE_INTERVAL == 0:
+        if self.frame_log is not None and self.frame_counter % FRAME_SAVE_INTERVAL == 0:
             self._backup_frame()
-
-        status = f"Frame:{self.frame_counter} Pos:({int(self.ball_x)},{int(self.ball_y)}) Dir:({self.dir_x:.2f},{self.dir_y:.2f}) Speed:{eff_speed:.1f}"
-        if (hr >= SILENT_START) or (hr < SILENT_END):
-            status += ' | SILENT'
-        if self.speed_boost_timer > 0:
-            status += f' | BOOST:{self.speed_boost_timer}'
-        try:
-            self.status_label.config(text=status)
-        except:
-            pass
-
-        self.master.after(16, self._animate_loop)
+        prof.lap('backup')
+
+        self._update_status(eff_speed, silent)
+        prof.lap('status')
+        prof.end()
+        if self.adaptive_quality:
+            frame_ms = (time.perf_counter() - t_start + self.scheduler.lateness) * 1000.0
+            level = self.governor.sample(frame_ms)
+            if level is not None:
+                self._apply_quality(level)
+        if prof.enabled and self.frame_counter % HUD_REFRESH == 0:
+            self._update_hud()
+
+def parse_args(argv=None):
+    ap = argparse.ArgumentParser(description='Retro CRT TV idle screen')
+    ap.add_argument('--seed', type=int, default=None, help='seed for the ball simulation')
+    ap.add_argument('--record', metavar='PATH', help='record seed, inputs and keyframes for exact replay')
+    ap.add_argument('--replay', metavar='PATH', help='replay a recording (Left/Right/Home to seek)')
+    ap.add_argument('--seek', type=int, default=0, metavar='FRAME', help='with --replay: start at this frame')
+    ap.add_argument('--fps', type=int, choices=TARGET_FPS_CHOICES, default=DEFAULT_FPS, help='target frame rate')
+    ap.add_argument('--renderer', choices=RENDERERS, default='canvas', help='canvas items or a NumPy framebuffer')
+    ap.add_argument('--crt', nargs='*', choices=CRT_EFFECTS, default=(), help='framebuffer only: CRT effects')
+    ap.add_argument('--config', metavar='PATH', help='load this JSON config at startup')
+    ap.add_argument('--kiosk', action='store_true', help='fullscreen, no control bar, no cursor')
+    ap.add_argument('--startup-log', metavar='PATH', default=None,
+                    help=f'append time-to-first-frame here (with --kiosk: {STARTUP_LOG} unless given)')
+    return ap.parse_args(argv)
 
 def main():
+    args = parse_args()
     root = tk.Tk()
-    app = ZigZagApp(root)
+    t_tk = time.perf_counter()
+    app = ZigZagApp(root, seed=args.seed, record_path=args.record, replay_path=args.replay, fps=args.fps,
+                    renderer=args.renderer, crt=args.crt, kiosk=args.kiosk,
+                    startup_log=args.startup_log or (STARTUP_LOG if args.kiosk else None))
+    if args.config:
+        try:
+            app.load_config_file(args.config)
+        except Exception as e:
+            print('Config error:', e)
+    app.startup_marks.update(tk=t_tk, app=time.perf_counter())
+    if args.replay and args.seek:
+        app.seek(args.seek)
     try:
         root.minsize(640, 480)
     except: